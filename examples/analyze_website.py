@@ -2,14 +2,18 @@
 Example script demonstrating how to use GeoSearch to analyze a website.
 """
 import os
+import re
 import sys
-from datetime import datetime
+import time
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.main import GeoSearch
 
+# Strips the scheme and turns path separators into underscores in one pass
+_DOMAIN_CLEAN_RE = re.compile(r'^https?://|/')
+
 def analyze_website(url: str):
     """
     Analyze a website and save the results.
@@ -25,8 +29,8 @@ def analyze_website(url: str):
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate output filename based on URL and timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    domain = url.replace("https://", "").replace("http://", "").replace("/", "_").strip("_")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    domain = _DOMAIN_CLEAN_RE.sub(lambda m: '_' if m.group(0) == '/' else '', url).strip("_")
     output_file = os.path.join(output_dir, f"{domain}_{timestamp}.json")
     
     try:
@@ -2,9 +2,85 @@
 AI Readability Analysis: SEO Structure Metrics
 """
 from typing import Dict, List
+from collections import Counter
+from itertools import islice
+from html.parser import HTMLParser
 import re
-import html5lib
-from html5lib.html5parser import ParseError
+
+# One pass over the markup counts semantic tags, divs and headings (in document order)
+_SECTION_TAG_RE = re.compile(r'<(header|nav|main|article|section|footer|div|h[1-6])\b[^>]*>', re.IGNORECASE)
+
+# Elements that never have an end tag, and elements whose end tag may be omitted
+_VOID_TAGS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                        'link', 'meta', 'param', 'source', 'track', 'wbr'])
+_OPTIONAL_END_TAGS = frozenset(['html', 'head', 'body', 'p', 'li', 'dt', 'dd', 'option',
+                                'optgroup', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
+                                'colgroup', 'rb', 'rt', 'rtc', 'rp'])
+
+# Explanation of each SEO structure metric when its value is below, within
+# and above the optimal range
+_SEO_EXPLANATIONS = {
+    'title_tag_length': (
+        "Too short: Title may not be optimal for AI/search context.",
+        "Optimal: Title is concise and clear for AI/search display.",
+        "Too long: Title may not be optimal for AI/search context.",
+    ),
+    'meta_description_length': (
+        "Missing: No meta description for AI/search snippet.",
+        "Optimal: Meta description is present and concise for AI/search snippets.",
+        "Too long: May be truncated in AI/search results.",
+    ),
+    'h1_tag_presence': (
+        "Missing: No H1 tag for main topic.",
+        "Optimal: Single H1 tag provides clear main topic for AI parsing.",
+        "Multiple H1 tags: Ambiguous main topic for AI.",
+    ),
+    'content_word_count': (
+        "Too little content: May be considered 'thin' by AI/search.",
+        "Optimal: Sufficient content for AI to understand and summarize.",
+        None,
+    ),
+}
+
+class _TagBalanceValidator(HTMLParser):
+    """
+    Streaming validator counting stray end tags and elements left unclosed.
+    
+    lxml's C parser is not used here. libxml2 reports stray and misnested end
+    tags (ERR_TAG_NAME_MISMATCH), but it closes elements left open without
+    any error, so a missing </footer> or <div><span></div> would go unseen.
+    It also flags every HTML5 sectioning element as an unknown tag.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.open_tags: List[str] = []
+        self.errors: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in _VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS:
+            return
+        if tag not in self.open_tags:
+            self.errors.append(f"Unexpected end tag </{tag}>")
+            return
+        while True:
+            open_tag = self.open_tags.pop()
+            if open_tag == tag:
+                break
+            self._unclosed(open_tag)
+
+    def close(self):
+        super().close()
+        while self.open_tags:
+            self._unclosed(self.open_tags.pop())
+
+    def _unclosed(self, tag):
+        if tag not in _OPTIONAL_END_TAGS:
+            self.errors.append(f"Unclosed element <{tag}>")
 
 class AIReadabilityAnalyzer:
     def __init__(self):
@@ -24,69 +100,33 @@ class AIReadabilityAnalyzer:
         """
         meta = seo_analysis.get('meta_tags', {})
         content = seo_analysis.get('content_analysis', {})
-        headings = content.get('heading_structure', {})
         
-        # Title Tag Length
-        title = meta.get('title', {}).get('content', '')
-        title_len = len(title)
-        title_flag = self.title_ideal_min <= title_len <= self.title_ideal_max
-        title_explanation = (
-            "Optimal: Title is concise and clear for AI/search display."
-            if title_flag else
-            f"{'Too short' if title_len < self.title_ideal_min else 'Too long'}: Title may not be optimal for AI/search context."
-        )
-
-        # Meta Description Length
-        meta_desc = meta.get('meta_description', {}).get('content', '')
-        meta_desc_len = len(meta_desc)
-        meta_desc_flag = 0 < meta_desc_len <= self.meta_desc_max
-        meta_desc_explanation = (
-            "Optimal: Meta description is present and concise for AI/search snippets."
-            if meta_desc_flag else
-            ("Missing: No meta description for AI/search snippet." if meta_desc_len == 0 else "Too long: May be truncated in AI/search results.")
+        # (metric, measured value, lowest optimal value, highest optimal value or None)
+        measures = (
+            ('title_tag_length', len(meta.get('title', {}).get('content', '')),
+             self.title_ideal_min, self.title_ideal_max),
+            ('meta_description_length', len(meta.get('meta_description', {}).get('content', '')),
+             1, self.meta_desc_max),
+            ('h1_tag_presence', content.get('heading_structure', {}).get('h1', 0), 1, 1),
+            ('content_word_count', len(content.get('main_content', '').split()),
+             self.content_word_min, None),
         )
-
-        # H1 Tag Presence
-        h1_count = headings.get('h1', 0)
-        h1_flag = h1_count == 1
-        h1_explanation = (
-            "Optimal: Single H1 tag provides clear main topic for AI parsing."
-            if h1_flag else
-            ("Missing: No H1 tag for main topic." if h1_count == 0 else "Multiple H1 tags: Ambiguous main topic for AI.")
-        )
-
-        # Content Word Count
-        main_content = content.get('main_content', '')
-        word_count = len(main_content.split())
-        content_flag = word_count >= self.content_word_min
-        content_explanation = (
-            "Optimal: Sufficient content for AI to understand and summarize."
-            if content_flag else
-            "Too little content: May be considered 'thin' by AI/search."
-        )
-
-        return {
-            'title_tag_length': {
-                'value': title_len,
-                'optimal': title_flag,
-                'explanation': title_explanation
-            },
-            'meta_description_length': {
-                'value': meta_desc_len,
-                'optimal': meta_desc_flag,
-                'explanation': meta_desc_explanation
-            },
-            'h1_tag_presence': {
-                'value': h1_count,
-                'optimal': h1_flag,
-                'explanation': h1_explanation
-            },
-            'content_word_count': {
-                'value': word_count,
-                'optimal': content_flag,
-                'explanation': content_explanation
+        
+        results = {}
+        for metric, value, low, high in measures:
+            below, optimal, above = _SEO_EXPLANATIONS[metric]
+            if value < low:
+                flag, explanation = False, below
+            elif high is not None and value > high:
+                flag, explanation = False, above
+            else:
+                flag, explanation = True, optimal
+            results[metric] = {
+                'value': value,
+                'optimal': flag,
+                'explanation': explanation
             }
-        }
+        return results
 
     def analyze_semantic_and_structure(self, html: str, seo_analysis: Dict) -> Dict:
         """
@@ -97,10 +137,20 @@ class AIReadabilityAnalyzer:
         Returns:
             dict: Metrics, flags, and AI-focused explanations
         """
+        # --- Tag census (single scan) ---
+        tag_counts = Counter()
+        heading_levels = []
+        for match in _SECTION_TAG_RE.finditer(html):
+            tag = match.group(1).lower()
+            if tag[0] == 'h' and tag != 'header':
+                heading_levels.append(int(tag[1]))
+            else:
+                tag_counts[tag] += 1
+
         # --- Semantic Element Usage ---
-        semantic_counts = {tag: len(re.findall(f'<{tag}[^>]*>', html, re.IGNORECASE)) for tag in self.semantic_tags}
+        semantic_counts = {tag: tag_counts[tag] for tag in self.semantic_tags}
         total_semantic = sum(semantic_counts.values())
-        total_div_sections = len(re.findall(r'<div[^>]*>', html, re.IGNORECASE))
+        total_div_sections = tag_counts['div']
         total_sections = total_semantic + total_div_sections
         semantic_ratio = total_semantic / total_sections if total_sections > 0 else 0
         semantic_flag = semantic_ratio >= 0.5  # Optimal if at least half are semantic
@@ -111,15 +161,10 @@ class AIReadabilityAnalyzer:
         )
 
         # --- HTML Validation Errors ---
-        parser = html5lib.HTMLParser(strict=True)
-        errors: List[ParseError] = []
-        try:
-            parser.parse(html)
-        except Exception as e:
-            # html5lib raises ParseError for each error, but doesn't collect all by default
-            # We'll use a regex fallback for common errors
-            errors = re.findall(r'<[^>]+$', html, re.MULTILINE)  # Unclosed tags at EOF
-        error_count = len(parser.errors) if hasattr(parser, 'errors') and parser.errors else len(errors)
+        validator = _TagBalanceValidator()
+        validator.feed(html)
+        validator.close()
+        error_count = len(validator.errors)
         html_valid_flag = error_count == 0
         html_valid_explanation = (
             "Optimal: No HTML validation errors detected."
@@ -128,8 +173,6 @@ class AIReadabilityAnalyzer:
         )
 
         # --- Heading Hierarchy Order ---
-        headings = re.findall(r'<h([1-6])[^>]*>', html, re.IGNORECASE)
-        heading_levels = [int(h) for h in headings]
         hierarchy_flag, hierarchy_explanation = self._check_heading_hierarchy(heading_levels)
 
         return {
@@ -156,9 +199,8 @@ class AIReadabilityAnalyzer:
         """Check for logical heading order (no skips)."""
         if not levels:
             return False, "No headings found."
-        prev = levels[0]
-        for curr in levels[1:]:
-            if curr > prev + 1:
+        # Pairwise walk without copying the list; stops at the first skip
+        for prev, curr in zip(levels, islice(levels, 1, None)):
+            if curr - prev > 1:
                 return False, f"Heading level skipped: h{prev} to h{curr}."
-            prev = curr
         return True, "Optimal: Heading hierarchy is logical and accessible." 
\ No newline at end of file
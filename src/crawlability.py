@@ -1,17 +1,69 @@
 """
 Crawlability analysis module for GeoSearch.
 """
+import copy
+import hashlib
+import html
+import io
 import re
 import time
+import threading
+import xml.etree.ElementTree as ET
 import requests
-from typing import Dict, Optional, Tuple, List
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, Optional, Tuple, List, Union
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 
+from .scraper import meta_index, parse_html
+
+_DISALLOW_RE = re.compile(r"Disallow:\s*(.*)")
+_CRAWL_DELAY_RE = re.compile(r"Crawl-delay:\s*(\d+)")
+
+# Markup between the text strings of a page: script and style blocks,
+# comments and tags. As in an HTML parser, a '<' only opens a tag when a tag
+# name, '/', '!' or '?' follows it, so text like "a < b" is kept
+_MARKUP_RE = re.compile(r'<(?:script|style)\b.*?</(?:script|style)\s*>|<!--.*?-->|<[A-Za-z/!?][^>]*>', re.I | re.S)
+
+def _utf8_length(text: str) -> int:
+    """Return the UTF-8 byte length of text, skipping the encode for ASCII strings."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
 class CrawlabilityAnalyzer:
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         self.ideal_text_ratio_range = (25, 70)  # percentage
         self.ideal_load_time = 2.0  # seconds
+        self.fetch_cache_ttl = 300  # seconds
+        self.fetch_cache_size = 128  # entries per cache; sitemap bodies can be large
+        self.result_cache_size = 1024
+        
+        # Weight factors for each component of the overall score
+        self.score_weights = {
+            "indexability": 0.3,
+            "sitemap": 0.2,
+            "text_ratio": 0.2,
+            "load_time": 0.15,
+            "llm_bot": 0.15
+        }
+        
+        # Executor for the network probes; without one each analysis starts a
+        # small pool of its own, so concurrent analyses never wait on each other
+        self._executor = executor
+        
+        # Shared keep-alive session and per-URL caches for robots.txt / sitemap.xml
+        self._session = requests.Session()
+        self._robots_cache: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+        self._sitemap_cache: "OrderedDict[str, Tuple[float, Optional[bytes]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Recent full analyses keyed by (url, content hash)
+        self._result_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, Dict]]" = OrderedDict()
+        
+        # Sections of the last robots.txt scanned, as every bot is usually
+        # checked against the same file in turn
+        self._last_sections: Optional[Tuple[str, Dict[str, List[str]]]] = None
         
         # Define LLM bots and their user agents
         self.llm_bots = {
@@ -61,36 +113,86 @@ class CrawlabilityAnalyzer:
                 'company': 'Meta'
             }
         }
+        
+        # One alternation over every known user agent, so a single scan of
+        # robots.txt yields each bot's "User-agent:" section
+        self._bot_user_agents = {
+            bot_name: bot_info['user_agent'] if isinstance(bot_info['user_agent'], list) else [bot_info['user_agent']]
+            for bot_name, bot_info in self.llm_bots.items()
+        }
+        self._user_agent_lookup = {
+            user_agent.lower(): user_agent
+            for user_agents in self._bot_user_agents.values()
+            for user_agent in user_agents
+        }
+        alternation = '|'.join(re.escape(ua) for ua in sorted(self._user_agent_lookup.values(), key=len, reverse=True))
+        self._user_agent_re = re.compile(
+            rf"^[ \t]*User-agent:[ \t]*({alternation})(?![\w-])[^\n]*((?:\n(?![ \t]*User-agent:)[^\n]*)*)",
+            re.IGNORECASE | re.MULTILINE
+        )
 
-    def analyze_crawlability(self, url: str, html_content: str) -> Dict:
+    def analyze_crawlability(self, url: str, html_content: Union[str, bytes],
+                             soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Analyze crawlability metrics for a given URL and its HTML content.
         
         Args:
             url (str): The URL to analyze
-            html_content (str): The HTML content of the page
+            html_content (Union[str, bytes]): The HTML content of the page, either
+                decoded or as the raw response body
+            soup (Optional[BeautifulSoup]): Already parsed tree of html_content,
+                to avoid parsing the page again
             
         Returns:
             dict: Crawlability analysis results
         """
+        content = html_content if isinstance(html_content, bytes) else html_content.encode('utf-8', 'surrogatepass')
+        key = (url, hashlib.blake2b(content, digest_size=16).digest())
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None and now - entry[0] < self.fetch_cache_ttl:
+                self._result_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+        
+        result = self._analyze_uncached(url, html_content, soup)
+        
+        with self._cache_lock:
+            self._result_cache[key] = (now, result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def _analyze_uncached(self, url: str, html_content: Union[str, bytes],
+                          soup: Optional[BeautifulSoup] = None) -> Dict:
+        """Run every crawlability check for a page."""
         # Get base URL for sitemap and robots.txt checking
         parsed_url = urlparse(url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
-        # Analyze indexability
-        indexability = self._analyze_indexability(html_content)
-        
-        # Check sitemap inclusion
-        sitemap_status = self._check_sitemap_inclusion(url, base_url)
-        
-        # Calculate text-to-HTML ratio
-        text_ratio = self._calculate_text_ratio(html_content)
-        
-        # Measure page load time
-        load_time = self._measure_load_time(url)
-        
-        # Analyze robots.txt for LLM bot directives
-        llm_bot_analysis = self._analyze_llm_bot_directives(base_url)
+        # The network probes are independent, so run them concurrently while
+        # the HTML-based checks run on this thread
+        pool = nullcontext(self._executor) if self._executor is not None else ThreadPoolExecutor(max_workers=3)
+        with pool as executor:
+            sitemap_future = executor.submit(self._check_sitemap_inclusion, url, base_url)
+            load_time_future = executor.submit(self._measure_load_time, url)
+            llm_bot_future = executor.submit(self._analyze_llm_bot_directives, base_url)
+            
+            # Parse once and share the tree between the HTML-based checks
+            if soup is None:
+                soup = self._parse(html_content)
+            
+            # Analyze indexability
+            indexability = self._analyze_indexability(html_content, soup)
+            
+            # Calculate text-to-HTML ratio
+            text_ratio = self._calculate_text_ratio(html_content)
+            
+            # Check sitemap inclusion, page load time and robots.txt LLM bot directives
+            sitemap_status = sitemap_future.result()
+            load_time = load_time_future.result()
+            llm_bot_analysis = llm_bot_future.result()
         
         return {
             "indexability": indexability,
@@ -103,14 +205,19 @@ class CrawlabilityAnalyzer:
             )
         }
 
-    def _analyze_indexability(self, html_content: str) -> Dict:
+    def _parse(self, html_content: Union[str, bytes]) -> BeautifulSoup:
+        """Parse HTML content into a tree shared by the HTML-based checks."""
+        return parse_html(html_content)
+
+    def _analyze_indexability(self, html_content: Union[str, bytes], soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Analyze if the page is indexable by checking robots meta tags and headers.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if soup is None:
+            soup = self._parse(html_content)
         
         # Check meta robots tag
-        robots_meta = soup.find('meta', attrs={'name': 'robots'})
+        robots_meta = meta_index(soup).get('robots')
         noindex = False
         nofollow = False
         
@@ -137,11 +244,9 @@ class CrawlabilityAnalyzer:
         sitemap_url = urljoin(base_url, '/sitemap.xml')
         
         try:
-            response = requests.get(sitemap_url, timeout=5)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'xml')
-                urls = soup.find_all('loc')
-                url_in_sitemap = any(url in loc.text for loc in urls)
+            sitemap_content = self._fetch_cached(self._sitemap_cache, sitemap_url, 'content')
+            if sitemap_content is not None:
+                url_in_sitemap = self._scan_sitemap(sitemap_content, url)
                 
                 return {
                     "sitemap_exists": True,
@@ -159,18 +264,65 @@ class CrawlabilityAnalyzer:
             "explanation": "No sitemap.xml found"
         }
 
-    def _calculate_text_ratio(self, html_content: str) -> Dict:
+    def _scan_sitemap(self, sitemap_content: bytes, url: str, depth: int = 0) -> bool:
         """
-        Calculate the ratio of text content to HTML code.
+        Stream the <loc> entries of a sitemap, stopping at the first exact match.
+        
+        URLs are compared exactly, ignoring a trailing slash, so a page is not
+        reported as listed just because a longer URL starts with it.
+        
+        Sitemap index files are followed one level down into their child sitemaps.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        target = url.rstrip('/')
+        is_index = False
+        child_sitemaps = []
+        try:
+            for event, elem in ET.iterparse(io.BytesIO(sitemap_content), events=('start', 'end')):
+                tag = elem.tag.rsplit('}', 1)[-1]
+                if event == 'start':
+                    if tag == 'sitemapindex':
+                        is_index = True
+                    continue
+                if tag == 'loc' and elem.text:
+                    if is_index:
+                        child_sitemaps.append(elem.text.strip())
+                    elif elem.text.strip().rstrip('/') == target:
+                        return True
+                elem.clear()
+        except ET.ParseError:
+            pass
         
-        # Get text content
-        text_content = soup.get_text(separator=' ', strip=True)
-        text_bytes = len(text_content.encode('utf-8'))
+        if depth == 0:
+            for child_url in child_sitemaps:
+                try:
+                    child_content = self._fetch_cached(self._sitemap_cache, child_url, 'content')
+                except requests.RequestException:
+                    continue
+                if child_content is not None and self._scan_sitemap(child_content, url, depth + 1):
+                    return True
+        return False
+
+    def _calculate_text_ratio(self, html_content: Union[str, bytes]) -> Dict:
+        """
+        Calculate the ratio of text content to HTML code.
         
-        # Get total HTML size
-        html_bytes = len(html_content.encode('utf-8'))
+        The text is measured on the raw markup, so no parsed tree is needed.
+        """
+        markup = html_content.decode('utf-8', 'replace') if isinstance(html_content, bytes) else html_content
+        
+        # Size of the text content as get_text(separator=' ', strip=True) would
+        # produce it, summed per string between tags instead of joining them
+        text_bytes = 0
+        string_count = 0
+        for segment in _MARKUP_RE.split(markup):
+            string = html.unescape(segment).strip() if '&' in segment else segment.strip()
+            if string:
+                text_bytes += _utf8_length(string)
+                string_count += 1
+        text_bytes += max(string_count - 1, 0)  # separators
+        
+        # Get total HTML size (a raw response body needs no encoding)
+        html_bytes = len(html_content) if isinstance(html_content, bytes) else _utf8_length(html_content)
         
         # Calculate ratio
         ratio = (text_bytes / html_bytes) * 100 if html_bytes > 0 else 0
@@ -185,12 +337,19 @@ class CrawlabilityAnalyzer:
 
     def _measure_load_time(self, url: str) -> Dict:
         """
-        Measure the page load time.
+        Measure the page load time as time to first byte.
+        
+        The body is streamed and the connection released after the first byte,
+        so large pages are not downloaded just to be timed.
         """
         try:
-            start_time = time.time()
-            response = requests.get(url, timeout=10)
-            load_time = time.time() - start_time
+            start_time = time.perf_counter()
+            response = self._session.get(url, timeout=10, stream=True)
+            try:
+                next(response.iter_content(1), b'')
+                load_time = time.perf_counter() - start_time
+            finally:
+                response.close()
             
             return {
                 "load_time": load_time,
@@ -221,14 +380,14 @@ class CrawlabilityAnalyzer:
         robots_content = None
         
         try:
-            response = requests.get(robots_url, timeout=5)
-            if response.status_code == 200:
-                robots_content = response.text
+            robots_content = self._fetch_cached(self._robots_cache, robots_url, 'text')
+            if robots_content is not None:
+                sections = self._extract_user_agent_sections(robots_content)
                 
                 # Analyze each LLM bot
                 for bot_name, bot_info in self.llm_bots.items():
-                    user_agents = bot_info['user_agent'] if isinstance(bot_info['user_agent'], list) else [bot_info['user_agent']]
-                    bot_directives[bot_name] = self._analyze_bot_directive(robots_content, user_agents, bot_info)
+                    user_agents = self._bot_user_agents[bot_name]
+                    bot_directives[bot_name] = self._analyze_bot_directive(robots_content, user_agents, bot_info, sections)
                 
                 return {
                     "robots_txt_exists": True,
@@ -246,7 +405,67 @@ class CrawlabilityAnalyzer:
             "summary": "No robots.txt found"
         }
 
-    def _analyze_bot_directive(self, robots_content: str, user_agents: List[str], bot_info: Dict) -> Dict:
+    def _fetch_cached(self, cache: OrderedDict, url: str, attr: str):
+        """
+        Fetch a site-level resource, reusing a recent result for the same URL.
+        
+        Only the fetch_cache_size most recently used URLs are kept.
+        
+        Args:
+            cache (OrderedDict): Cache mapping URL to (fetch time, body)
+            url (str): URL of the resource
+            attr (str): Response attribute to keep ('text' or 'content')
+            
+        Returns:
+            The response body, or None if the resource is not available
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = cache.get(url)
+            if entry is not None and now - entry[0] < self.fetch_cache_ttl:
+                cache.move_to_end(url)
+                return entry[1]
+        
+        response = self._session.get(url, timeout=5)
+        body = getattr(response, attr) if response.status_code == 200 else None
+        with self._cache_lock:
+            cache[url] = (now, body)
+            cache.move_to_end(url)
+            while len(cache) > self.fetch_cache_size:
+                cache.popitem(last=False)
+        return body
+
+    def _extract_user_agent_sections(self, robots_content: str) -> Dict[str, List[str]]:
+        """
+        Collect the robots.txt sections of every known LLM bot in one scan.
+        
+        The result for the last file scanned is kept, so repeated lookups
+        against the same robots.txt do not scan it again. It is shared and
+        must not be modified.
+        
+        Args:
+            robots_content (str): Content of robots.txt
+            
+        Returns:
+            dict: Lowercased user agent mapped to the text of its sections
+        """
+        last = self._last_sections
+        if last is not None and last[0] == robots_content:
+            return last[1]
+        
+        sections: Dict[str, List[str]] = {}
+        
+        # Cheap screen: lowercase once and skip the scan when no known bot is named
+        robots_lower = robots_content.lower()
+        if any(user_agent in robots_lower for user_agent in self._user_agent_lookup):
+            for match in self._user_agent_re.finditer(robots_content):
+                sections.setdefault(match.group(1).lower(), []).append(match.group(0))
+        
+        self._last_sections = (robots_content, sections)
+        return sections
+
+    def _analyze_bot_directive(self, robots_content: str, user_agents: List[str], bot_info: Dict,
+                               sections: Optional[Dict[str, List[str]]] = None) -> Dict:
         """
         Analyze directives for a specific bot in robots.txt.
         
@@ -254,10 +473,14 @@ class CrawlabilityAnalyzer:
             robots_content (str): Content of robots.txt
             user_agents (List[str]): List of user agents to check
             bot_info (Dict): Bot information dictionary
+            sections (Optional[Dict[str, List[str]]]): Pre-extracted user agent sections
             
         Returns:
             dict: Analysis of bot directives
         """
+        if sections is None:
+            sections = self._extract_user_agent_sections(robots_content)
+        
         directives = {
             "allowed": True,
             "disallowed_paths": [],
@@ -268,27 +491,24 @@ class CrawlabilityAnalyzer:
         
         # Check each user agent
         for user_agent in user_agents:
-            if user_agent.lower() in robots_content.lower():
-                directives["user_agents_found"].append(user_agent)
+            user_agent_sections = sections.get(user_agent.lower())
+            if not user_agent_sections:
+                continue
+            directives["user_agents_found"].append(user_agent)
+            
+            for section_text in user_agent_sections:
+                directives["directives_found"].append(section_text)
                 
-                # Find the section for this user agent
-                pattern = rf"(?i)User-agent:\s*{re.escape(user_agent)}.*?(?=User-agent:|$)"
-                section = re.search(pattern, robots_content, re.DOTALL)
+                # Check for Disallow directives
+                disallows = _DISALLOW_RE.findall(section_text)
+                if disallows:
+                    directives["disallowed_paths"].extend(disallows)
+                    directives["allowed"] = False
                 
-                if section:
-                    section_text = section.group(0)
-                    directives["directives_found"].append(section_text)
-                    
-                    # Check for Disallow directives
-                    disallows = re.findall(r"Disallow:\s*(.*)", section_text)
-                    if disallows:
-                        directives["disallowed_paths"].extend(disallows)
-                        directives["allowed"] = False
-                    
-                    # Check for Crawl-delay
-                    crawl_delay = re.search(r"Crawl-delay:\s*(\d+)", section_text)
-                    if crawl_delay:
-                        directives["crawl_delay"] = int(crawl_delay.group(1))
+                # Check for Crawl-delay
+                crawl_delay = _CRAWL_DELAY_RE.search(section_text)
+                if crawl_delay:
+                    directives["crawl_delay"] = int(crawl_delay.group(1))
         
         return {
             "bot_name": bot_info['user_agent'][0] if isinstance(bot_info['user_agent'], list) else bot_info['user_agent'],
@@ -339,15 +559,6 @@ class CrawlabilityAnalyzer:
         """
         Compute overall crawlability score.
         """
-        # Weight factors for each metric
-        weights = {
-            "indexability": 0.3,
-            "sitemap": 0.2,
-            "text_ratio": 0.2,
-            "load_time": 0.15,
-            "llm_bot": 0.15
-        }
-        
         # Calculate individual scores
         indexability_score = 1.0 if indexability["is_indexable"] else 0.0
         sitemap_score = 1.0 if sitemap_status["url_in_sitemap"] else 0.5 if sitemap_status["sitemap_exists"] else 0.0
@@ -361,24 +572,20 @@ class CrawlabilityAnalyzer:
             total_bots = len(llm_bot_analysis["bot_directives"])
             llm_bot_score = allowed_bots / total_bots if total_bots > 0 else 0.5
         
+        components = {
+            "indexability": indexability_score,
+            "sitemap": sitemap_score,
+            "text_ratio": text_ratio_score,
+            "load_time": load_time_score,
+            "llm_bot": llm_bot_score
+        }
+        
         # Calculate weighted score
-        overall_score = (
-            indexability_score * weights["indexability"] +
-            sitemap_score * weights["sitemap"] +
-            text_ratio_score * weights["text_ratio"] +
-            load_time_score * weights["load_time"] +
-            llm_bot_score * weights["llm_bot"]
-        )
+        overall_score = sum(components[name] * weight for name, weight in self.score_weights.items())
         
         return {
             "score": overall_score,
-            "components": {
-                "indexability": indexability_score,
-                "sitemap": sitemap_score,
-                "text_ratio": text_ratio_score,
-                "load_time": load_time_score,
-                "llm_bot": llm_bot_score
-            },
+            "components": components,
             "explanation": self._get_overall_score_explanation(overall_score)
         }
 
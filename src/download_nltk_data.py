@@ -3,19 +3,38 @@ Script to download required NLTK data.
 """
 import nltk
 
+def _is_installed(resource: str) -> bool:
+    """Check whether an NLTK resource is already available locally."""
+    try:
+        nltk.data.find(resource)
+        return True
+    except LookupError:
+        return False
+
 def download_nltk_data():
     """Download required NLTK data packages."""
-    required_packages = [
-        'punkt',  # For sentence tokenization
-        'averaged_perceptron_tagger',  # For part-of-speech tagging
-        'wordnet',  # For word meanings and synonyms
-        'stopwords'  # For stop words
-    ]
-    
-    for package in required_packages:
-        print(f"Downloading {package}...")
+    required_packages = {
+        'cmudict': 'corpora/cmudict',  # For syllable counting
+        'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',  # For part-of-speech tagging
+        'wordnet': 'corpora/wordnet',  # For word meanings and synonyms
+        'stopwords': 'corpora/stopwords'  # For stop words
+    }
+
+    missing = []
+    for package, resource in required_packages.items():
+        if _is_installed(resource):
+            print(f"✓ {package} already installed")
+        else:
+            missing.append(package)
+
+    if not missing:
+        return
+
+    # Only the missing packages are fetched. nltk.download shares one
+    # downloader and its index between calls, so they run one at a time
+    for package in missing:
         nltk.download(package, quiet=True)
         print(f"✓ {package} downloaded successfully")
 
 if __name__ == "__main__":
-    download_nltk_data() 
\ No newline at end of file
+    download_nltk_data()
\ No newline at end of file
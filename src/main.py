@@ -4,19 +4,149 @@ Main script for GeoSearch - SEO and Gemini Analysis Tool
 import os
 import json
 import argparse
+import hashlib
+import shelve
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
-from dotenv import load_dotenv
-from .scraper import WebScraper
-from .seo_analyzer import SEOAnalyzer
-from .seo_metrics import SEOMetrics
-from .ai_readability import AIReadabilityAnalyzer
-from .crawlability import CrawlabilityAnalyzer
-from .readability import ReadabilityAnalyzer
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON encoder
+    orjson = None
+
+# The analyzers, bs4 and dotenv are imported where they are first used so
+# that `--help` and argument errors don't pay for loading them
+
+_ENV_LOADED = False
+
+def _load_env():
+    """Load environment variables from .env, at most once per process."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            pass
+        else:
+            load_dotenv()
+        _ENV_LOADED = True
+
+_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.geosearch', 'cache')
+# Results include network probes (load time, robots.txt, sitemap), so they
+# are kept no longer than the crawlability checks reuse those
+_CACHE_TTL = 300
+
+@lru_cache(maxsize=64)
+def _iso_timestamp(epoch_sec: int) -> str:
+    """Format a whole-second epoch as a local ISO 8601 timestamp."""
+    return datetime.fromtimestamp(epoch_sec).isoformat()
+
+_SUMMARY_TEMPLATE = """
+📊 SEO Analysis Summary
+{rule}
+
+📑 Meta Information:
+• Title: {title} ({title_length} chars)
+• Meta Description: {meta_description}...
+• Robots Directive: {robots}
+
+📝 Content Analysis:
+• Total Words: {total_words}
+• Unique Words: {unique_words}
+• Paragraphs: {paragraph_count}
+• Text/HTML Ratio: {text_html_ratio:.2f}%
+
+🔗 Link Analysis:
+• Internal Links: {internal_links}
+• External Links: {external_links}
+
+🖼️ Image Analysis:
+• Total Images: {total_images}
+• Images with Alt Text: {images_with_alt}
+• Images with Dimensions: {images_with_dimensions}
+
+⚙️ Technical SEO:
+• Viewport Meta: {has_viewport}
+• Favicon: {has_favicon}
+• Structured Data: {has_structured_data}
+• Analytics: {has_analytics}
+
+🔑 Top Keywords:{keyword_lines}
+
+📈 Advanced Metrics
+{rule}
+
+📊 Content Quality:
+• Content Length Score: {content_quality[content_length_score]:.2%}
+• Heading Structure Score: {content_quality[heading_structure_score]:.2%}
+• Paragraph Structure Score: {content_quality[paragraph_structure_score]:.2%}
+• Overall Content Score: {content_quality[overall_content_score]:.2%}
+
+📚 Readability:
+• Flesch Reading Ease: {readability_metrics[flesch_reading_ease]:.1f}
+• Readability Level: {readability_metrics[readability_level]}
+• Average Sentence Length: {readability_metrics[avg_sentence_length]:.1f} words
+
+🔍 Keyword Optimization:
+• Keyword Optimization Score: {keyword_optimization_score:.2%}
+
+🔗 Link Quality:
+• Internal/External Ratio: {link_quality[internal_external_ratio]:.2%}
+• Link Text Quality Score: {link_quality[overall_link_quality_score]:.2%}
+
+🖼️ Image Optimization:
+• Alt Text Score: {image_optimization[alt_text_score]:.2%}
+• Dimensions Score: {image_optimization[dimensions_score]:.2%}
+• Overall Image Score: {image_optimization[overall_image_score]:.2%}
+
+📊 Overall Scores:
+• Technical Score: {technical_score:.2%}
+• Overall SEO Score: {overall_score:.2%}
+
+🤖 AI Readability:
+SEO Structure: {ai_title}
+Semantic Usage: {ai_semantic}
+HTML Validation: {ai_validation}
+Heading Hierarchy: {ai_headings}
+
+🕷️ Crawlability:
+Indexability: {crawl_indexability}
+Sitemap Status: {crawl_sitemap}
+Text-to-HTML Ratio: {crawl_text_ratio}
+Page Load Time: {crawl_load_time}
+Overall Crawlability: {crawl_overall}
+
+📚 Text Readability:
+Flesch Reading Ease: {text_flesch}
+Sentence Length: {text_sentence_length}
+Lexical Complexity: {text_lexical}
+Overall Readability: {text_overall}{bot_lines}"""
 
 class GeoSearch:
-    def __init__(self):
-        """Initialize GeoSearch with its components."""
+    def __init__(self, use_cache: bool = False, cache_path: str = _CACHE_PATH, verbose: bool = False):
+        """
+        Initialize GeoSearch with its components.
+        
+        Args:
+            use_cache (bool): Reuse stored results for pages whose content is
+                unchanged, for up to five minutes
+            cache_path (str): Location of the persistent result cache
+            verbose (bool): Print progress as it happens instead of once per URL
+        """
+        from .scraper import WebScraper
+        from .seo_analyzer import SEOAnalyzer
+        from .seo_metrics import SEOMetrics
+        from .ai_readability import AIReadabilityAnalyzer
+        from .crawlability import CrawlabilityAnalyzer
+        from .readability import ReadabilityAnalyzer
+        
+        _load_env()
+        
         self.scraper = WebScraper()
         self.seo_analyzer = SEOAnalyzer()
         self.metrics = SEOMetrics()
@@ -24,8 +154,12 @@ class GeoSearch:
         self.crawlability = CrawlabilityAnalyzer()
         self.readability = ReadabilityAnalyzer()
         
-        # Load environment variables
-        load_dotenv()
+        # Persistent cache of analyses keyed by URL and page content
+        self.use_cache = use_cache
+        self.cache_path = cache_path
+        self._cache_lock = threading.Lock()
+        
+        self.verbose = verbose
         
     def analyze_url(self, url: str, output_file: Optional[str] = None) -> Dict:
         """
@@ -38,48 +172,152 @@ class GeoSearch:
         Returns:
             dict: Analysis results
         """
-        print(f"\n🔍 Analyzing URL: {url}")
-        
-        # Fetch the page
-        print("📥 Fetching page content...")
-        html_content = self.scraper.fetch_page(url)
-        if not html_content:
-            return {"error": f"Failed to fetch content from {url}"}
+        # Progress messages are collected and written in one go when the URL
+        # is done, unless verbose output was requested
+        log: List[str] = []
+        try:
+            self._progress(log, f"\n🔍 Analyzing URL: {url}")
             
-        # Perform SEO analysis
-        print("📊 Performing SEO analysis...")
-        seo_results = self.seo_analyzer.analyze(html_content, url)
-        
-        # Compute advanced metrics
-        print("📈 Computing advanced metrics...")
-        metrics_results = self.metrics.compute_metrics(seo_results)
-        
-        # Perform AI readability analysis
-        ai_readability = self.analyze_ai_readability(html_content, seo_results)
+            # Fetch the page
+            self._progress(log, "📥 Fetching page content...")
+            html_content = self.scraper.fetch_page(url)
+            if not html_content:
+                return {"error": f"Failed to fetch content from {url}"}
+                
+            cache_key = self._cache_key(url, html_content)
+            analysis = self._load_cached(cache_key) if self.use_cache else None
+            if analysis is None:
+                analysis = self._run_analysis(url, html_content, log)
+                if self.use_cache:
+                    self._store_cached(cache_key, analysis)
+            else:
+                self._progress(log, "♻️ Page unchanged, reusing cached analysis...")
+            
+            # Combine results
+            results = {
+                'url': url,
+                'timestamp': _iso_timestamp(time.time_ns() // 1_000_000_000),
+                **analysis
+            }
+            
+            # Save results if output file is specified
+            if output_file:
+                self._save_results(results, output_file)
+                self._progress(log, f"💾 Results saved to: {output_file}")
+                
+            return results
+        finally:
+            if log:
+                sys.stdout.write("\n".join(log) + "\n")
+    
+    def _progress(self, log: List[str], message: str):
+        """Report a progress message, immediately if verbose or else via log."""
+        if self.verbose:
+            print(message, flush=True)
+        else:
+            log.append(message)
+    
+    def _run_analysis(self, url: str, html_content: str, log: List[str]) -> Dict:
+        """Run every analyzer over the fetched page."""
+        from .scraper import parse_html
         
-        # Perform crawlability analysis
-        crawlability_analysis = self.crawlability.analyze_crawlability(url, html_content)
+        # Parse once and share the tree between the SEO and crawlability
+        # analyzers; re-analyzing an unchanged page reuses the earlier tree
+        soup = parse_html(html_content)
         
-        # Perform text readability analysis
-        readability_analysis = self.readability.analyze_readability(html_content)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Crawlability mostly waits on robots.txt, sitemap.xml and the load
+            # time probe, so start it first and overlap it with the CPU-bound
+            # analyzers below
+            crawlability_future = executor.submit(
+                self.crawlability.analyze_crawlability, url, html_content, soup
+            )
+            
+            # Perform SEO analysis
+            self._progress(log, "📊 Performing SEO analysis...")
+            seo_results = self.seo_analyzer.analyze(html_content, url, soup)
+            
+            # Compute advanced metrics
+            self._progress(log, "📈 Computing advanced metrics...")
+            metrics_results = self.metrics.compute_metrics(seo_results)
+            
+            # Perform AI readability analysis
+            ai_readability = self.analyze_ai_readability(html_content, seo_results)
+            
+            # Perform text readability analysis
+            readability_analysis = self.readability.analyze_readability(html_content)
+            
+            # Perform crawlability analysis
+            crawlability_analysis = crawlability_future.result()
         
-        # Combine results
-        results = {
-            'url': url,
-            'timestamp': datetime.now().isoformat(),
+        return {
             'seo_analysis': seo_results,
             'advanced_metrics': metrics_results,
             'ai_readability': ai_readability,
             'crawlability': crawlability_analysis,
             'readability': readability_analysis
         }
+    
+    @staticmethod
+    def _cache_key(url: str, html_content: str) -> str:
+        """Build the cache key for a page from its URL and content."""
+        digest = hashlib.sha256(url.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(html_content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _load_cached(self, key: str) -> Optional[Dict]:
+        """Return the cached analysis for key if present and not expired."""
+        # A missing, truncated or corrupt cache is treated as a miss
+        try:
+            with self._cache_lock, shelve.open(self.cache_path, 'r') as cache:
+                entry = cache.get(key)
+            if entry is None:
+                return None
+            stored_at, analysis = entry
+        except Exception:
+            return None
+        
+        if time.time() - stored_at > _CACHE_TTL:
+            return None
+        return analysis
+    
+    def _store_cached(self, key: str, analysis: Dict):
+        """Persist an analysis in the cache."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with self._cache_lock, shelve.open(self.cache_path) as cache:
+                cache[key] = (time.time(), analysis)
+        except Exception:
+            # Caching is best effort; the analysis itself succeeded
+            pass
+    
+    def analyze_urls(self, urls: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Analyze several URLs concurrently.
         
-        # Save results if output file is specified
-        if output_file:
-            self._save_results(results, output_file)
-            print(f"💾 Results saved to: {output_file}")
+        Each page spends most of its time waiting on the network (page fetch,
+        robots.txt, sitemap.xml, load time), so the URLs are analyzed on a
+        thread pool and their I/O overlaps.
+        
+        Args:
+            urls (List[str]): URLs to analyze
+            max_workers (int): Maximum number of URLs analyzed at once
             
-        return results
+        Returns:
+            List[Dict]: Analysis results, in the same order as urls
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self._analyze_one, urls))
+    
+    def _analyze_one(self, url: str) -> Dict:
+        """Analyze a single URL, reporting failures as an error result."""
+        try:
+            return self.analyze_url(url)
+        except Exception as e:
+            return {"url": url, "error": str(e)}
     
     def analyze_ai_readability(self, content: str, seo_analysis: Dict) -> Dict:
         """
@@ -103,9 +341,14 @@ class GeoSearch:
             "semantic_structure": semantic_structure
         }
     
-    def _save_results(self, results: Dict, output_file: str):
+    def _save_results(self, results, output_file: str):
         """Save analysis results to a JSON file."""
         os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
             
@@ -123,124 +366,80 @@ class GeoSearch:
         links = seo['link_analysis']
         images = seo['image_analysis']
         technical = seo['technical_seo']
-        
-        summary = [
-            "\n📊 SEO Analysis Summary",
-            "=" * 50,
-            
-            "\n📑 Meta Information:",
-            f"• Title: {meta['title']['content']} ({meta['title']['length']} chars)",
-            f"• Meta Description: {meta['meta_description']['content'][:100]}...",
-            f"• Robots Directive: {meta['robots'] or 'Not specified'}",
-            
-            "\n📝 Content Analysis:",
-            f"• Total Words: {seo['keyword_analysis']['total_words']}",
-            f"• Unique Words: {seo['keyword_analysis']['unique_words']}",
-            f"• Paragraphs: {content['paragraph_count']}",
-            f"• Text/HTML Ratio: {content['text_html_ratio']:.2f}%",
-            
-            "\n🔗 Link Analysis:",
-            f"• Internal Links: {links['internal_links']['count']}",
-            f"• External Links: {links['external_links']['count']}",
-            
-            "\n🖼️ Image Analysis:",
-            f"• Total Images: {images['total_images']}",
-            f"• Images with Alt Text: {images['images_with_alt']}",
-            f"• Images with Dimensions: {images['images_with_dimensions']}",
-            
-            "\n⚙️ Technical SEO:",
-            f"• Viewport Meta: {'✅' if technical['has_viewport'] else '❌'}",
-            f"• Favicon: {'✅' if technical['has_favicon'] else '❌'}",
-            f"• Structured Data: {'✅' if technical['has_structured_data'] else '❌'}",
-            f"• Analytics: {'✅' if technical['has_analytics'] else '❌'}",
-            
-            "\n🔑 Top Keywords:",
-        ]
+        keywords = seo['keyword_analysis']
+        semantic = ai['semantic_structure']
+        bots = crawl['llm_bot_analysis']
         
         # Add top 5 keywords
-        for word, data in list(seo['keyword_analysis']['top_keywords'].items())[:5]:
-            summary.append(f"• {word}: {data['count']} times ({data['density']:.2f}%)")
-            
-        # Add advanced metrics
-        summary.extend([
-            "\n📈 Advanced Metrics",
-            "=" * 50,
-            
-            "\n📊 Content Quality:",
-            f"• Content Length Score: {metrics['content_quality']['content_length_score']:.2%}",
-            f"• Heading Structure Score: {metrics['content_quality']['heading_structure_score']:.2%}",
-            f"• Paragraph Structure Score: {metrics['content_quality']['paragraph_structure_score']:.2%}",
-            f"• Overall Content Score: {metrics['content_quality']['overall_content_score']:.2%}",
-            
-            "\n📚 Readability:",
-            f"• Flesch Reading Ease: {metrics['readability']['flesch_reading_ease']:.1f}",
-            f"• Readability Level: {metrics['readability']['readability_level']}",
-            f"• Average Sentence Length: {metrics['readability']['avg_sentence_length']:.1f} words",
-            
-            "\n🔍 Keyword Optimization:",
-            f"• Keyword Optimization Score: {metrics['keyword_optimization']['keyword_optimization_score']:.2%}",
-            
-            "\n🔗 Link Quality:",
-            f"• Internal/External Ratio: {metrics['link_quality']['internal_external_ratio']:.2%}",
-            f"• Link Text Quality Score: {metrics['link_quality']['overall_link_quality_score']:.2%}",
-            
-            "\n🖼️ Image Optimization:",
-            f"• Alt Text Score: {metrics['image_optimization']['alt_text_score']:.2%}",
-            f"• Dimensions Score: {metrics['image_optimization']['dimensions_score']:.2%}",
-            f"• Overall Image Score: {metrics['image_optimization']['overall_image_score']:.2%}",
-            
-            "\n📊 Overall Scores:",
-            f"• Technical Score: {metrics['technical_score']['overall_technical_score']:.2%}",
-            f"• Overall SEO Score: {metrics['overall_score']['overall_score']:.2%}",
-        ])
-            
-        # Add AI readability summary
-        summary.extend([
-            "\n🤖 AI Readability:",
-            f"SEO Structure: {ai['seo_structure']['title_tag_length']['explanation']}",
-            f"Semantic Usage: {ai['semantic_structure']['semantic_element_usage']['explanation']}",
-            f"HTML Validation: {ai['semantic_structure']['html_validation_errors']['explanation']}",
-            f"Heading Hierarchy: {ai['semantic_structure']['heading_hierarchy_order']['explanation']}"
-        ])
-            
-        # Add crawlability summary
-        summary.extend([
-            "\n🕷️ Crawlability:",
-            f"Indexability: {crawl['indexability']['explanation']}",
-            f"Sitemap Status: {crawl['sitemap_status']['explanation']}",
-            f"Text-to-HTML Ratio: {crawl['text_ratio']['explanation']}",
-            f"Page Load Time: {crawl['load_time']['explanation']}",
-            f"Overall Crawlability: {crawl['overall_score']['explanation']}"
-        ])
-            
-        # Add text readability summary
-        summary.extend([
-            "\n📚 Text Readability:",
-            f"Flesch Reading Ease: {readability['flesch_reading_ease']['explanation']}",
-            f"Sentence Length: {readability['average_sentence_length']['explanation']}",
-            f"Lexical Complexity: {readability['lexical_complexity']['explanation']}",
-            f"Overall Readability: {readability['overall_score']['explanation']}"
-        ])
-            
+        keyword_lines = "".join(
+            f"\n• {word}: {data['count']} times ({data['density']:.2f}%)"
+            for word, data in islice(keywords['top_keywords'].items(), 5)
+        )
+        
         # Add LLM bot analysis section
-        if crawl['llm_bot_analysis']['robots_txt_exists']:
-            summary.extend([
-                "\n🤖 LLM Bot Analysis:",
-                f"Robots.txt: {crawl['llm_bot_analysis']['robots_txt_url']}",
-                f"Summary: {crawl['llm_bot_analysis']['summary']}"
+        bot_lines = []
+        if bots['robots_txt_exists']:
+            bot_lines.extend([
+                "\n\n🤖 LLM Bot Analysis:",
+                f"\nRobots.txt: {bots['robots_txt_url']}",
+                f"\nSummary: {bots['summary']}"
             ])
             
             # Add detailed bot directives
-            for bot_name, directive in crawl['llm_bot_analysis']['bot_directives'].items():
+            for bot_name, directive in bots['bot_directives'].items():
                 if directive['user_agents_found']:
-                    summary.append(f"\n{bot_name} ({directive['company']}):")
-                    summary.append(f"• {directive['explanation']}")
+                    bot_lines.append(f"\n\n{bot_name} ({directive['company']}):")
+                    bot_lines.append(f"\n• {directive['explanation']}")
                     if directive['crawl_delay']:
-                        summary.append(f"• Crawl delay: {directive['crawl_delay']}s")
+                        bot_lines.append(f"\n• Crawl delay: {directive['crawl_delay']}s")
                     if directive['disallowed_paths']:
-                        summary.append(f"• Blocked paths: {', '.join(directive['disallowed_paths'])}")
-
-        return "\n".join(summary)
+                        bot_lines.append(f"\n• Blocked paths: {', '.join(directive['disallowed_paths'])}")
+        
+        def check(flag: bool) -> str:
+            return '✅' if flag else '❌'
+        
+        return _SUMMARY_TEMPLATE.format_map({
+            'rule': "=" * 50,
+            'title': meta['title']['content'],
+            'title_length': meta['title']['length'],
+            'meta_description': meta['meta_description']['content'][:100],
+            'robots': meta['robots'] or 'Not specified',
+            'total_words': keywords['total_words'],
+            'unique_words': keywords['unique_words'],
+            'paragraph_count': content['paragraph_count'],
+            'text_html_ratio': content['text_html_ratio'],
+            'internal_links': links['internal_links']['count'],
+            'external_links': links['external_links']['count'],
+            'total_images': images['total_images'],
+            'images_with_alt': images['images_with_alt'],
+            'images_with_dimensions': images['images_with_dimensions'],
+            'has_viewport': check(technical['has_viewport']),
+            'has_favicon': check(technical['has_favicon']),
+            'has_structured_data': check(technical['has_structured_data']),
+            'has_analytics': check(technical['has_analytics']),
+            'keyword_lines': keyword_lines,
+            'content_quality': metrics['content_quality'],
+            'readability_metrics': metrics['readability'],
+            'keyword_optimization_score': metrics['keyword_optimization']['keyword_optimization_score'],
+            'link_quality': metrics['link_quality'],
+            'image_optimization': metrics['image_optimization'],
+            'technical_score': metrics['technical_score']['overall_technical_score'],
+            'overall_score': metrics['overall_score']['overall_score'],
+            'ai_title': ai['seo_structure']['title_tag_length']['explanation'],
+            'ai_semantic': semantic['semantic_element_usage']['explanation'],
+            'ai_validation': semantic['html_validation_errors']['explanation'],
+            'ai_headings': semantic['heading_hierarchy_order']['explanation'],
+            'crawl_indexability': crawl['indexability']['explanation'],
+            'crawl_sitemap': crawl['sitemap_status']['explanation'],
+            'crawl_text_ratio': crawl['text_ratio']['explanation'],
+            'crawl_load_time': crawl['load_time']['explanation'],
+            'crawl_overall': crawl['overall_score']['explanation'],
+            'text_flesch': readability['flesch_reading_ease']['explanation'],
+            'text_sentence_length': readability['average_sentence_length']['explanation'],
+            'text_lexical': readability['lexical_complexity']['explanation'],
+            'text_overall': readability['overall_score']['explanation'],
+            'bot_lines': "".join(bot_lines)
+        })
 
 def main():
     """Main entry point for the script."""
@@ -250,8 +449,10 @@ def main():
     )
     
     parser.add_argument(
-        'url',
-        help="URL to analyze"
+        'urls',
+        nargs='+',
+        metavar='url',
+        help="URL(s) to analyze"
     )
     
     parser.add_argument(
@@ -266,16 +467,38 @@ def main():
         action='store_true'
     )
     
+    parser.add_argument(
+        '--cache',
+        help="Reuse and store results in the persistent result cache",
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '-v', '--verbose',
+        help="Print progress messages as each step starts",
+        action='store_true'
+    )
+    
     args = parser.parse_args()
     
     try:
         # Initialize and run analysis
-        geo_search = GeoSearch()
-        results = geo_search.analyze_url(args.url, args.output)
+        geo_search = GeoSearch(use_cache=args.cache, verbose=args.verbose)
+        if len(args.urls) == 1:
+            all_results = [geo_search.analyze_url(args.urls[0], args.output)]
+        else:
+            all_results = geo_search.analyze_urls(args.urls)
+            if args.output:
+                geo_search._save_results(all_results, args.output)
+                print(f"💾 Results saved to: {args.output}")
         
         # Display summary unless --no-summary is specified
         if not args.no_summary:
-            print(geo_search._format_seo_summary(results))
+            for results in all_results:
+                if 'error' in results:
+                    print(f"\n❌ Error: {results['error']}")
+                else:
+                    print(geo_search._format_seo_summary(results))
             
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
@@ -1,27 +1,96 @@
 """
 Text readability analysis module for GeoSearch.
 """
+import copy
+import hashlib
+import os
 import re
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar, Dict, List, NamedTuple, Optional, Tuple
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import cmudict
 
+# Flesch and lexical complexity only need word and sentence boundaries, so
+# plain regexes stand in for NLTK's Punkt and Treebank tokenizers. Words must
+# start with a letter, so punctuation never reaches syllable counting
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z']*")
+_SENT_RE = re.compile(r'[^.!?]*\w[^.!?]*(?:[.!?]+|$)')
+_VOWEL_RUN_RE = re.compile(r'[aeiouy]+')
+
+# One scan cleans HTML for analysis: runs of tags and whitespace collapse to a
+# single space and any character outside letters, digits, whitespace and
+# .,!? is dropped
+_CLEAN_RE = re.compile(r'(?P<space>(?:\s|<[^>]+>)+)|[^A-Za-z0-9\s.,!?<]+|<')
+
+def _clean_sub(match: re.Match) -> str:
+    return ' ' if match.group('space') else ''
+
+# Below this many texts a process pool costs more to start than it saves
+PARALLEL_THRESHOLD = 16
+
+# Analyzer reused by every task a pool worker runs
+_worker_analyzer: Optional['ReadabilityAnalyzer'] = None
+
+def _analyze_one(text: str) -> Dict:
+    """Analyze one text inside a pool worker."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ReadabilityAnalyzer()
+    return _worker_analyzer.analyze_readability(text)
+
+class TextStats(NamedTuple):
+    """Word and syllable totals gathered in one pass over the sentences."""
+    sentence_count: int
+    word_count: int
+    total_syllables: int
+    complex_words: int
+    optimal_sentences: int
+
+# Statistics of a text without any words
+_EMPTY_STATS = TextStats(0, 0, 0, 0, 0)
+
 class ReadabilityAnalyzer:
+    # The CMU dictionary takes hundreds of milliseconds to load, so it is
+    # loaded on first use, reduced to a word -> syllable count table and
+    # shared by every instance
+    _CMU_SYL: ClassVar[Optional[Dict[str, int]]] = None
+    _CMU_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
-        # Download required NLTK data
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/cmudict')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('cmudict')
-        
-        self.cmudict = cmudict.dict()
         self.ideal_sentence_length = 14  # words
         self.max_sentence_length = 20    # words
         self.complex_word_threshold = 3  # syllables
         self.complex_word_percentage_threshold = 15  # percentage
+        
+        # Word frequencies are Zipfian, so most syllable lookups are repeats
+        self.syllable_cache_size = 100_000
+        self._syllable_cache: Dict[str, int] = {}
+        
+        # The same page often goes through several pipelines, so recent
+        # analyses are kept by a digest of their text
+        self.analysis_cache_size = 128
+        self._analysis_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._analysis_lock = threading.Lock()
+
+    @classmethod
+    def _get_cmu_syllables(cls) -> Dict[str, int]:
+        """Return the shared CMU syllable counts, loading them on first use."""
+        if cls._CMU_SYL is None:
+            with cls._CMU_LOCK:
+                if cls._CMU_SYL is None:
+                    # Download required NLTK data
+                    try:
+                        nltk.data.find('corpora/cmudict')
+                    except LookupError:
+                        nltk.download('cmudict')
+                    # Syllables are the stressed phones of the first pronunciation
+                    cls._CMU_SYL = {
+                        word: sum(1 for phone in prons[0] if phone[-1].isdigit())
+                        for word, prons in cmudict.dict().items()
+                    }
+        return cls._CMU_SYL
 
     def analyze_readability(self, text: str) -> Dict:
         """
@@ -33,17 +102,55 @@ class ReadabilityAnalyzer:
         Returns:
             dict: Readability analysis results
         """
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._analysis_lock:
+            result = self._analysis_cache.get(key)
+            if result is not None:
+                self._analysis_cache.move_to_end(key)
+        
+        if result is None:
+            result = self.analyze_stats(self.text_stats(text))
+            with self._analysis_lock:
+                self._analysis_cache[key] = result
+                while len(self._analysis_cache) > self.analysis_cache_size:
+                    self._analysis_cache.popitem(last=False)
+        # Hand out a copy so callers cannot alter the cached entry
+        return copy.deepcopy(result)
+
+    def text_stats(self, text: str) -> TextStats:
+        """
+        Tokenize text once into the statistics every readability metric uses.
+        
+        Args:
+            text (str): Text to analyze
+            
+        Returns:
+            TextStats: Sentence, word, syllable and complex word counts
+        """
         # Clean and prepare text
         cleaned_text = self._clean_text(text)
         
+        # Text without a single word needs no sentence splitting or tokenizing
+        if not _WORD_RE.search(cleaned_text):
+            return _EMPTY_STATS
+        
         # Get basic text statistics
-        sentences = sent_tokenize(cleaned_text)
-        words = word_tokenize(cleaned_text)
+        return self._collect_stats(_SENT_RE.findall(cleaned_text))
+
+    def analyze_stats(self, stats: TextStats) -> Dict:
+        """
+        Compute readability metrics from already collected text statistics.
         
+        Args:
+            stats (TextStats): Output of text_stats
+            
+        Returns:
+            dict: Readability analysis results
+        """
         # Calculate metrics
-        flesch_score = self._calculate_flesch_score(sentences, words)
-        avg_sentence_length = self._calculate_avg_sentence_length(sentences, words)
-        lexical_complexity = self._calculate_lexical_complexity(words)
+        flesch_score = self._calculate_flesch_score(stats)
+        avg_sentence_length = self._calculate_avg_sentence_length(stats)
+        lexical_complexity = self._calculate_lexical_complexity(stats)
         
         return {
             "flesch_reading_ease": flesch_score,
@@ -52,22 +159,59 @@ class ReadabilityAnalyzer:
             "overall_score": self._compute_overall_score(flesch_score, avg_sentence_length, lexical_complexity)
         }
 
+    def analyze_batch(self, texts: List[str], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze the readability of many texts, in parallel for large batches.
+        
+        Args:
+            texts (List[str]): Texts to analyze
+            workers (Optional[int]): Number of worker processes, defaults to the CPU count
+            
+        Returns:
+            List[Dict]: Readability analysis results, in the same order as texts
+        """
+        if len(texts) < PARALLEL_THRESHOLD:
+            return [self.analyze_readability(text) for text in texts]
+        
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(texts) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_one, texts, chunksize=chunksize))
+
     def _clean_text(self, text: str) -> str:
         """Clean text for analysis."""
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep sentence endings
-        text = re.sub(r'[^a-zA-Z0-9\s.,!?]', '', text)
-        return text.strip()
-
-    def _calculate_flesch_score(self, sentences: List[str], words: List[str]) -> Dict:
+        return _CLEAN_RE.sub(_clean_sub, text).strip()
+
+    def _collect_stats(self, sentences: List[str]) -> TextStats:
+        """Tokenize each sentence once and accumulate every count the metrics need."""
+        word_count = 0
+        total_syllables = 0
+        complex_words = 0
+        optimal_sentences = 0
+        word_freq: Counter = Counter()
+        
+        for sentence in sentences:
+            words = _WORD_RE.findall(sentence.lower())
+            word_count += len(words)
+            if len(words) <= self.ideal_sentence_length:
+                optimal_sentences += 1
+            word_freq.update(words)
+        
+        # Syllables are counted once per distinct word and weighted by frequency
+        for word, count in word_freq.items():
+            syllables = self._count_syllables(word)
+            total_syllables += syllables * count
+            if syllables >= self.complex_word_threshold:
+                complex_words += count
+        
+        return TextStats(len(sentences), word_count, total_syllables, complex_words, optimal_sentences)
+
+    def _calculate_flesch_score(self, stats: TextStats) -> Dict:
         """
         Calculate Flesch Reading Ease score.
         Formula: RE = 206.835 - 1.015*(words/sentence) - 84.6*(syllables/word)
         """
-        if not sentences or not words:
+        if not stats.sentence_count or not stats.word_count:
             return {
                 "score": 0,
                 "explanation": "No text content to analyze",
@@ -75,11 +219,10 @@ class ReadabilityAnalyzer:
             }
         
         # Calculate average sentence length
-        avg_sentence_length = len(words) / len(sentences)
+        avg_sentence_length = stats.word_count / stats.sentence_count
         
         # Calculate average syllables per word
-        total_syllables = sum(self._count_syllables(word) for word in words)
-        avg_syllables = total_syllables / len(words)
+        avg_syllables = stats.total_syllables / stats.word_count
         
         # Calculate Flesch score
         score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables)
@@ -109,20 +252,19 @@ class ReadabilityAnalyzer:
             "explanation": f"Flesch Reading Ease: {score:.1f} ({level})"
         }
 
-    def _calculate_avg_sentence_length(self, sentences: List[str], words: List[str]) -> Dict:
+    def _calculate_avg_sentence_length(self, stats: TextStats) -> Dict:
         """Calculate average sentence length."""
-        if not sentences:
+        if not stats.sentence_count:
             return {
                 "score": 0,
                 "explanation": "No sentences found",
                 "is_optimal": False
             }
         
-        avg_length = len(words) / len(sentences)
+        avg_length = stats.word_count / stats.sentence_count
         
         # Calculate percentage of sentences within optimal range
-        optimal_sentences = sum(1 for s in sentences if len(word_tokenize(s)) <= self.ideal_sentence_length)
-        optimal_percentage = (optimal_sentences / len(sentences)) * 100
+        optimal_percentage = (stats.optimal_sentences / stats.sentence_count) * 100
         
         return {
             "avg_length": avg_length,
@@ -131,46 +273,49 @@ class ReadabilityAnalyzer:
             "explanation": self._get_sentence_length_explanation(avg_length, optimal_percentage)
         }
 
-    def _calculate_lexical_complexity(self, words: List[str]) -> Dict:
+    def _calculate_lexical_complexity(self, stats: TextStats) -> Dict:
         """Calculate lexical complexity based on complex word percentage."""
-        if not words:
+        if not stats.word_count:
             return {
                 "score": 0,
                 "explanation": "No words found",
                 "is_optimal": False
             }
         
-        # Count complex words (3+ syllables)
-        complex_words = sum(1 for word in words if self._count_syllables(word) >= self.complex_word_threshold)
-        complex_percentage = (complex_words / len(words)) * 100
+        # Complex words (3+ syllables) were counted while collecting stats
+        complex_percentage = (stats.complex_words / stats.word_count) * 100
         
         return {
-            "complex_words": complex_words,
+            "complex_words": stats.complex_words,
             "complex_percentage": complex_percentage,
             "is_optimal": complex_percentage <= self.complex_word_percentage_threshold,
             "explanation": self._get_lexical_complexity_explanation(complex_percentage)
         }
 
     def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word using CMU dictionary."""
+        """Count syllables in a word, memoized per lowercased word."""
         word = word.lower()
-        try:
-            return len([x for x in self.cmudict[word][0] if x[-1].isdigit()])
-        except KeyError:
-            # Fallback to simple syllable counting
-            count = 0
-            vowels = 'aeiouy'
-            word = word.lower()
-            if word[0] in vowels:
-                count += 1
-            for index in range(1, len(word)):
-                if word[index] in vowels and word[index - 1] not in vowels:
-                    count += 1
-            if word.endswith('e'):
-                count -= 1
-            if count == 0:
-                count += 1
+        count = self._syllable_cache.get(word)
+        if count is None:
+            count = self._count_syllables_uncached(word)
+            if len(self._syllable_cache) < self.syllable_cache_size:
+                self._syllable_cache[word] = count
+        return count
+
+    def _count_syllables_uncached(self, word: str) -> int:
+        """Count syllables in a lowercased word using CMU dictionary."""
+        if not word:
+            return 0
+        count = self._get_cmu_syllables().get(word)
+        if count is not None:
             return count
+        
+        # Fallback to simple syllable counting: one per run of vowels,
+        # less a silent final 'e'
+        count = len(_VOWEL_RUN_RE.findall(word))
+        if word.endswith('e'):
+            count -= 1
+        return count or 1
 
     def _compute_overall_score(self, flesch: Dict, sentence_length: Dict, lexical: Dict) -> Dict:
         """Compute overall readability score."""
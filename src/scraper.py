@@ -1,13 +1,138 @@
 """
 Web scraping module for extracting website content.
 """
+import hashlib
+import re
+import threading
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
+from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+# Prefer the C-based lxml builder, falling back to the pure-Python parser.
+# Every module that builds a BeautifulSoup tree uses this choice.
+try:
+    import lxml
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# selectolax's lexbor engine is a much faster extractor for the few fields
+# we need; BeautifulSoup remains the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Connections kept open per host; matches fetch_many's default concurrency
+POOL_SIZE = 32
+
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+_WS_RE = re.compile(r'\s+')
+
+# Recently parsed pages keyed by a digest of their content. Trees take many
+# times the memory of the page itself, so only a few are kept.
+PARSE_CACHE_SIZE = 16
+_parse_cache: "OrderedDict[bytes, BeautifulSoup]" = OrderedDict()
+_parse_lock = threading.Lock()
+
+# Pages whose validators and body each WebScraper keeps for revalidation
+VALIDATOR_CACHE_SIZE = 256
+
+def parse_html(html: Union[str, bytes]) -> BeautifulSoup:
+    """
+    Parse a page, reusing the tree when the same content was parsed recently.
+    
+    The returned tree is shared between callers and must not be modified.
+    
+    Args:
+        html (Union[str, bytes]): HTML content, decoded or as the raw response body
+        
+    Returns:
+        BeautifulSoup: Parsed tree of html
+    """
+    content = html if isinstance(html, bytes) else html.encode('utf-8', 'surrogatepass')
+    key = hashlib.blake2b(content, digest_size=16).digest()
+    with _parse_lock:
+        soup = _parse_cache.get(key)
+        if soup is not None:
+            _parse_cache.move_to_end(key)
+            return soup
+    
+    soup = BeautifulSoup(html, DEFAULT_PARSER)
+    with _parse_lock:
+        _parse_cache[key] = soup
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return soup
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_HIDDEN_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+_HIDDEN_TEXT_SELECTOR = ','.join(sorted(_HIDDEN_TEXT_TAGS))
+
+def _visible_text(node) -> str:
+    """Join the text below a selectolax node, skipping comments and hidden elements."""
+    parts = []
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            parts.append(child.text_content or '')
+        elif not child.tag.startswith('-') and child.tag not in _HIDDEN_TEXT_TAGS:
+            parts.append(_visible_text(child))
+    return ''.join(parts)
+
+def lexbor_text(node) -> str:
+    """Get the text of a selectolax node as BeautifulSoup's get_text() would."""
+    # Most elements hold no hidden elements, and lexbor joins their text in C
+    if node.css_first(_HIDDEN_TEXT_SELECTOR) is None:
+        return node.text()
+    return _visible_text(node)
+
+def meta_index(soup: BeautifulSoup) -> Dict[str, Tag]:
+    """
+    Map each meta tag name on a page to its first tag, built once per tree.
+    
+    The index is stored on the tree, so every check reading meta tags from a
+    shared tree reuses it instead of searching the tree again.
+    
+    Args:
+        soup (BeautifulSoup): Parsed page
+        
+    Returns:
+        Dict[str, Tag]: Lowercased name attribute mapped to its first meta tag
+    """
+    index = soup.__dict__.get('_meta_index')
+    if index is None:
+        index = {}
+        for meta in soup.find_all('meta', attrs={'name': True}):
+            index.setdefault(meta['name'].lower(), meta)
+        soup.__dict__['_meta_index'] = index
+    return index
 
 class WebScraper:
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_bytes: int = 5 * 1024 * 1024, use_selectolax: bool = True):
         self.timeout = timeout
+        # Extract with selectolax when installed, unless the BeautifulSoup path is requested
+        self.use_selectolax = use_selectolax and LexborHTMLParser is not None
+        # Pages larger than this are truncated rather than buffered whole
+        self.max_bytes = max_bytes
+        
+        # Reuse pooled connections (and TLS sessions) across fetches
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        # Size the pool for concurrent fetches and retry dropped connections
+        # briefly; read timeouts are not retried, so a slow page costs one timeout
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                              max_retries=Retry(total=2, read=0, backoff_factor=0.2))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Validators and body of recently fetched pages, keyed by URL, so
+        # unchanged pages come back as a 304 without a body
+        self._cache: "OrderedDict[str, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
     def fetch_page(self, url: str) -> Optional[str]:
         """
@@ -19,14 +144,76 @@ class WebScraper:
         Returns:
             Optional[str]: HTML content if successful, None otherwise
         """
+        headers = {}
+        with self._cache_lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                self._cache.move_to_end(url)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
+            response = self.session.get(url, timeout=self.timeout, stream=True, headers=headers)
+            try:
+                if cached is not None and response.status_code == 304:
+                    return cached[2]
+                response.raise_for_status()
+                
+                # Stream the body so oversized pages stop at max_bytes
+                body = bytearray()
+                truncated = False
+                for chunk in response.iter_content(64 * 1024):
+                    body += chunk
+                    if len(body) >= self.max_bytes:
+                        del body[self.max_bytes:]
+                        truncated = True
+                        break
+                
+                html = body.decode(response.encoding or 'utf-8', errors='replace')
+                self._remember(url, response, html, truncated)
+                return html
+            finally:
+                response.close()
         except Exception as e:
             print(f"Error fetching {url}: {str(e)}")
             return None
             
+    def _remember(self, url: str, response: requests.Response, html: str, truncated: bool = False):
+        """
+        Cache a fetched page under its validators, unless the server forbids
+        storing it or the body was cut off at max_bytes.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._cache_lock:
+            if truncated or 'no-store' in response.headers.get('Cache-Control', '').lower() or not (etag or last_modified):
+                self._cache.pop(url, None)
+                return
+            self._cache[url] = (etag, last_modified, html)
+            self._cache.move_to_end(url)
+            while len(self._cache) > VALIDATOR_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            
+    def fetch_many(self, urls: List[str], max_workers: int = POOL_SIZE) -> List[Optional[str]]:
+        """
+        Fetch several webpages concurrently.
+        
+        Args:
+            urls (List[str]): The URLs to fetch
+            max_workers (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[Optional[str]]: HTML content for each URL, None where the fetch failed
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.fetch_page, urls))
+            
     def extract_content(self, html: str) -> Dict:
         """
         Extract relevant content from HTML.
@@ -37,7 +224,11 @@ class WebScraper:
         Returns:
             Dict: Extracted content including title, meta description, and main text
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        if self.use_selectolax:
+            return self._extract_with_selectolax(html)
+        
+        # The extraction only reads the tree, so a recently parsed one is reused
+        soup = parse_html(html)
         
         return {
             'title': self._get_title(soup),
@@ -46,6 +237,25 @@ class WebScraper:
             'headers': self._get_headers(soup)
         }
         
+    def _extract_with_selectolax(self, html: str) -> Dict:
+        """Extract the same fields as extract_content using selectolax."""
+        tree = LexborHTMLParser(html)
+        
+        title_tag = tree.css_first('title')
+        # Meta names are matched case-insensitively, as meta_index does
+        meta = tree.css_first('meta[name="description" i]')
+        
+        headers: Dict[str, list] = {}
+        for node in tree.css(','.join(_HEADING_TAGS)):
+            headers.setdefault(node.tag, []).append(lexbor_text(node).strip())
+        
+        return {
+            'title': title_tag.text().strip() if title_tag else '',
+            'meta_description': (meta.attributes.get('content') or '').strip() if meta else '',
+            'main_content': self._clean_whitespace(lexbor_text(tree.root)),
+            'headers': {name: headers[name] for name in _HEADING_TAGS if name in headers}
+        }
+        
     def _get_title(self, soup: BeautifulSoup) -> str:
         """Extract page title."""
         title_tag = soup.find('title')
@@ -53,30 +263,23 @@ class WebScraper:
         
     def _get_meta_description(self, soup: BeautifulSoup) -> str:
         """Extract meta description."""
-        meta = soup.find('meta', attrs={'name': 'description'})
+        meta = meta_index(soup).get('description')
         return meta.get('content', '').strip() if meta else ''
         
     def _get_main_content(self, soup: BeautifulSoup) -> str:
         """Extract main content text."""
-        # Remove script and style elements
-        for script in soup(['script', 'style']):
-            script.decompose()
-            
-        # Get text content
-        text = soup.get_text()
+        # get_text skips script and style contents (and comments), so the
+        # tree is left untouched for the other extractors and for reuse
+        return self._clean_whitespace(soup.get_text())
         
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text
+    def _clean_whitespace(self, text: str) -> str:
+        """Collapse every run of whitespace in extracted text to a single space."""
+        return _WS_RE.sub(' ', text).strip()
         
     def _get_headers(self, soup: BeautifulSoup) -> Dict[str, list]:
         """Extract all headers (h1-h6) from the page."""
-        headers = {}
-        for i in range(1, 7):
-            h_tags = soup.find_all(f'h{i}')
-            if h_tags:
-                headers[f'h{i}'] = [tag.text.strip() for tag in h_tags]
-        return headers 
\ No newline at end of file
+        # One traversal for all heading levels, bucketed by tag name
+        found: Dict[str, list] = {}
+        for tag in soup.find_all(_HEADING_TAGS):
+            found.setdefault(tag.name, []).append(tag.text.strip())
+        return {name: found[name] for name in _HEADING_TAGS if name in found}
\ No newline at end of file
@@ -1,72 +1,270 @@
 """
 SEO Analysis module for extracting and analyzing SEO-related metrics from websites.
 """
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import heapq
+import html as html_lib
+import os
 import re
-from urllib.parse import urljoin, urlparse
+from operator import itemgetter
+from urllib.parse import urljoin, urlsplit
+
+from .scraper import DEFAULT_PARSER, LexborHTMLParser, lexbor_text
+from .seo_constants import STOP_WORDS
+
+# selectolax's lexbor engine builds the tree and runs the tag query in C, so
+# it is the default when installed; any BeautifulSoup builder can be chosen
+LEXBOR = 'lexbor'
+DEFAULT_SEO_PARSER = LEXBOR if LexborHTMLParser is not None else DEFAULT_PARSER
+
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# The only tags the analysis reads from the tree; everything else is skipped
+# while parsing. Meta tags are read straight from the raw HTML instead.
+_ANALYZED_TAGS = ['title', 'p', 'img', 'a', 'link', 'script'] + _HEADING_TAGS
+_ANALYZED_STRAINER = SoupStrainer(_ANALYZED_TAGS)
+
+# Tag query matching _ANALYZED_TAGS for the lexbor engine
+_ANALYZED_SELECTOR = ','.join(_ANALYZED_TAGS)
+
+# A meta tag (quoted attribute values may contain '>'), or a comment or a
+# script, style or textarea body to skip, as markup there is not a tag
+_META_RE = re.compile(
+    r'<!--.*?-->|<(script|style|textarea)\b.*?</\1\s*>'
+    r'|<meta\b(?P<attrs>(?:[^>"\']|"[^"]*"|\'[^\']*\')*)>',
+    re.I | re.S
+)
+_ATTR_RE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+
+# Markup to drop when reading the page text straight from the raw HTML:
+# the elements get_text() leaves out (an rt or rp body runs to the next ruby
+# tag, as its end tag is optional), comments and tags. A '<' only opens a tag
+# when a tag name, '/', '!' or '?' follows it, so text like "a < b" is kept
+_NON_TEXT_RE = re.compile(
+    r'<(script|style|template)\b.*?</\1\s*>|<(?:rt|rp)\b.*?(?=</?(?:rt|rp|ruby)\b)'
+    r'|<!--.*?-->|<[A-Za-z/!?][^>]*>',
+    re.I | re.S
+)
+
+_WORD_RE = re.compile(r'\w+')
+_ANALYTICS_RE = re.compile(r'gtag|ga|analytics')
+_CHARSET_RE = re.compile(r'charset=([^\s]*)')
+
+# Batches smaller than this are analyzed in-process; starting worker
+# processes costs more than it saves on a handful of pages
+PARALLEL_THRESHOLD = 16
+
+# Pages with fewer keyword candidates than this report no top keywords
+MIN_KEYWORD_WORDS = 20
+
+# Analyzers reused by every task a pool worker runs, keyed by parser
+_worker_analyzers: Dict[str, 'SEOAnalyzer'] = {}
+
+class _LexborTag:
+    """Read-only view of a selectolax node answering the Tag calls the analysis makes."""
+    __slots__ = ('name', 'attrs', '_node')
+
+    def __init__(self, node):
+        self.name = node.tag
+        self._node = node
+        # Valueless attributes read as '' and rel is split into a list, as
+        # BeautifulSoup does
+        attrs = node.attributes
+        if None in attrs.values():
+            attrs = {key: value or '' for key, value in attrs.items()}
+        if 'rel' in attrs:
+            attrs['rel'] = attrs['rel'].split()
+        self.attrs = attrs
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def get_text(self) -> str:
+        return lexbor_text(self._node)
+
+    @property
+    def string(self) -> Optional[str]:
+        return self._node.text() or None
+
+def _analyze_page(parser: str, page: Tuple[str, str]) -> Dict:
+    """Analyze one (html, base_url) page inside a pool worker."""
+    analyzer = _worker_analyzers.get(parser)
+    if analyzer is None:
+        analyzer = _worker_analyzers[parser] = SEOAnalyzer(parser)
+    return analyzer.analyze(*page)
 
 class SEOAnalyzer:
-    def __init__(self):
+    # Fixed attribute layout, without a per-instance __dict__
+    __slots__ = ('parser', 'important_tags', 'stop_words')
+
+    def __init__(self, parser: str = DEFAULT_SEO_PARSER):
+        # 'lexbor' or the BeautifulSoup tree builder used when analyze() is
+        # not handed a soup
+        if parser == LEXBOR and LexborHTMLParser is None:
+            raise ValueError("The lexbor parser requires selectolax")
+        self.parser = parser
         self.important_tags = ['title', 'meta', 'h1', 'h2', 'h3', 'img', 'a']
-        self.stop_words = {'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i', 
-                          'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at'}
+        self.stop_words = STOP_WORDS
 
-    def analyze(self, html: str, base_url: str) -> Dict:
+    def analyze(self, html: str, base_url: str, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Perform comprehensive SEO analysis on the HTML content.
         
         Args:
             html (str): Raw HTML content
             base_url (str): Base URL of the page for resolving relative links
+            soup (Optional[BeautifulSoup]): Already parsed tree of html, to
+                avoid parsing the page again
             
         Returns:
             Dict: Complete SEO analysis results
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        if soup is not None:
+            tags = self._collect(soup)
+            text = soup.get_text()
+        else:
+            # Build only the analyzed tags; the page text then has to come
+            # from the raw HTML, since the strained tree lacks most of it
+            if self.parser == LEXBOR:
+                tags = self._collect_lexbor(html)
+            else:
+                tags = self._collect(BeautifulSoup(html, self.parser, parse_only=_ANALYZED_STRAINER))
+            text = self._get_raw_text(html)
+        
+        tags['meta'] = self._scan_meta_tags(html)
         
         return {
-            'meta_tags': self._analyze_meta_tags(soup),
-            'keyword_analysis': self._analyze_keywords(soup),
-            'content_analysis': self._analyze_content(soup),
-            'link_analysis': self._analyze_links(soup, base_url),
-            'image_analysis': self._analyze_images(soup),
-            'technical_seo': self._analyze_technical_seo(soup),
+            'meta_tags': self._analyze_meta_tags(tags),
+            'keyword_analysis': self._analyze_keywords(text),
+            'content_analysis': self._analyze_content(tags, text, len(html)),
+            'link_analysis': self._analyze_links(tags, base_url),
+            'image_analysis': self._analyze_images(tags),
+            'technical_seo': self._analyze_technical_seo(tags),
             'url_structure': self._analyze_url_structure(base_url)
         }
 
-    def _analyze_meta_tags(self, soup: BeautifulSoup) -> Dict:
+    def analyze_batch(self, pages: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze many pages, in parallel worker processes for large batches.
+        
+        Args:
+            pages (List[Tuple[str, str]]): (html, base_url) pairs to analyze
+            workers (Optional[int]): Number of worker processes, defaults to the CPU count
+            
+        Returns:
+            List[Dict]: SEO analysis results, in the same order as pages
+        """
+        if len(pages) < PARALLEL_THRESHOLD:
+            return [self.analyze(html, base_url) for html, base_url in pages]
+        
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(pages) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(_analyze_page, self.parser), pages, chunksize=chunksize))
+
+    def _collect(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """
+        Gather every analyzed tag in a single traversal of the tree.
+        
+        Args:
+            soup (BeautifulSoup): Parsed page
+            
+        Returns:
+            Dict[str, List[Tag]]: Tags in document order, keyed by tag name
+        """
+        tags: Dict[str, List[Tag]] = {name: [] for name in _ANALYZED_TAGS}
+        for tag in soup.find_all(_ANALYZED_TAGS):
+            tags[tag.name].append(tag)
+        return tags
+
+    def _collect_lexbor(self, html: str) -> Dict[str, List[_LexborTag]]:
+        """
+        Parse a page with lexbor and gather every analyzed tag in one query.
+        
+        Args:
+            html (str): Raw HTML content
+            
+        Returns:
+            Dict[str, List[_LexborTag]]: Tags in document order, keyed by tag name
+        """
+        tags: Dict[str, List[_LexborTag]] = {name: [] for name in _ANALYZED_TAGS}
+        for node in LexborHTMLParser(html).css(_ANALYZED_SELECTOR):
+            tags[node.tag].append(_LexborTag(node))
+        return tags
+
+    def _scan_meta_tags(self, html: str) -> List[Dict[str, str]]:
+        """
+        Read the attributes of every meta tag with a regex over the raw HTML.
+        
+        The dicts answer .get() like a parsed Tag would, so meta lookups work
+        on them unchanged.
+        
+        Args:
+            html (str): Raw HTML content
+            
+        Returns:
+            List[Dict[str, str]]: Attributes of each meta tag in document order
+        """
+        metas = []
+        for match in _META_RE.finditer(html):
+            if match.group('attrs') is None:
+                continue
+            attrs: Dict[str, str] = {}
+            for name, double, single, bare in _ATTR_RE.findall(match.group('attrs')):
+                attrs.setdefault(name.lower(), html_lib.unescape(double or single or bare))
+            metas.append(attrs)
+        return metas
+
+    def _analyze_meta_tags(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Analyze meta tags including OpenGraph and Twitter cards."""
         meta_tags = {
-            'title': self._get_title_info(soup),
-            'meta_description': self._get_meta_description(soup),
-            'robots': self._get_meta_content(soup, 'robots'),
-            'viewport': self._get_meta_content(soup, 'viewport'),
-            'charset': self._get_charset(soup),
-            'canonical': self._get_canonical_url(soup),
-            'og_tags': self._get_opengraph_tags(soup),
-            'twitter_cards': self._get_twitter_cards(soup)
+            'title': self._get_title_info(tags),
+            'meta_description': self._get_meta_description(tags),
+            'robots': self._get_meta_content(tags, 'robots'),
+            'viewport': self._get_meta_content(tags, 'viewport'),
+            'charset': self._get_charset(tags),
+            'canonical': self._get_canonical_url(tags),
+            'og_tags': self._get_opengraph_tags(tags),
+            'twitter_cards': self._get_twitter_cards(tags)
         }
         return meta_tags
 
-    def _analyze_keywords(self, soup: BeautifulSoup) -> Dict:
+    def _get_raw_text(self, html: str) -> str:
+        """Get the visible text of a page by stripping markup from the raw HTML."""
+        return html_lib.unescape(_NON_TEXT_RE.sub('', html))
+
+    def _analyze_keywords(self, text: str) -> Dict:
         """Analyze keyword usage and density."""
-        text = soup.get_text()
-        words = re.findall(r'\w+', text.lower())
-        words = [w for w in words if w not in self.stop_words and len(w) > 2]
+        # Count every token in C first, then filter stop words and short
+        # words once per distinct word rather than once per occurrence
+        token_counts = Counter(_WORD_RE.findall(text.lower()))
+        stop_words = self.stop_words
+        word_freq = {
+            word: count for word, count in token_counts.items()
+            if len(word) > 2 and word not in stop_words
+        }
+        total_words = sum(word_freq.values())
         
-        # Calculate keyword frequency
-        word_freq = Counter(words)
-        total_words = len(words)
+        # Densities over a handful of words (navigation-only pages) are noise
+        if total_words < MIN_KEYWORD_WORDS:
+            return {
+                'top_keywords': {},
+                'total_words': total_words,
+                'unique_words': len(word_freq)
+            }
         
-        # Get top keywords with density
+        # Get top keywords with density; a bounded heap picks the top ten
+        # without sorting every distinct word
         top_keywords = {
             word: {
                 'count': count,
                 'density': (count / total_words) * 100 if total_words > 0 else 0
             }
-            for word, count in word_freq.most_common(10)
+            for word, count in heapq.nlargest(10, word_freq.items(), key=itemgetter(1))
         }
         
         return {
@@ -75,40 +273,47 @@ class SEOAnalyzer:
             'unique_words': len(word_freq)
         }
 
-    def _analyze_content(self, soup: BeautifulSoup) -> Dict:
+    def _analyze_content(self, tags: Dict[str, List[Tag]], text: str, html_length: int) -> Dict:
         """Analyze content structure and readability."""
-        paragraphs = soup.find_all('p')
-        headings = {f'h{i}': len(soup.find_all(f'h{i}')) for i in range(1, 7)}
+        paragraphs = tags['p']
+        headings = {name: len(tags[name]) for name in _HEADING_TAGS}
         
         return {
             'paragraph_count': len(paragraphs),
             'heading_structure': headings,
             'avg_paragraph_length': self._calculate_avg_length(paragraphs),
-            'content_length': len(soup.get_text()),
-            'text_html_ratio': self._calculate_text_html_ratio(soup)
+            'content_length': len(text),
+            'text_html_ratio': self._calculate_text_html_ratio(text, html_length)
         }
 
-    def _analyze_links(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _analyze_links(self, tags: Dict[str, List[Tag]], base_url: str) -> Dict:
         """Analyze internal and external links."""
-        links = soup.find_all('a', href=True)
+        links = [link for link in tags['a'] if link.get('href') is not None]
         internal_links = []
         external_links = []
         
-        base_domain = urlparse(base_url).netloc
+        base_domain = urlsplit(base_url).netloc
+        # Navigation repeats the same hrefs many times over, so each distinct
+        # href is resolved and classified only once per page
+        resolved: Dict[str, Tuple[str, bool]] = {}
         
         for link in links:
             href = link.get('href')
-            absolute_url = urljoin(base_url, href)
-            parsed_url = urlparse(absolute_url)
+            target = resolved.get(href)
+            if target is None:
+                absolute_url = urljoin(base_url, href)
+                target = resolved[href] = (absolute_url, self._is_internal(href, absolute_url, base_domain))
+            absolute_url, internal = target
+            rel = link.attrs.get('rel')
             
             link_info = {
                 'url': absolute_url,
                 'text': link.get_text().strip(),
                 'title': link.get('title', ''),
-                'nofollow': 'nofollow' in link.get('rel', [])
+                'nofollow': rel is not None and 'nofollow' in rel
             }
             
-            if parsed_url.netloc == base_domain:
+            if internal:
                 internal_links.append(link_info)
             else:
                 external_links.append(link_info)
@@ -124,41 +329,61 @@ class SEOAnalyzer:
             }
         }
 
-    def _analyze_images(self, soup: BeautifulSoup) -> Dict:
+    def _is_internal(self, href: str, absolute_url: str, base_domain: str) -> bool:
+        """Check whether a link stays on the page's domain."""
+        # Fragment, query and root-relative hrefs cannot name another host;
+        # '//' is protocol-relative and does
+        if href[:1] in ('#', '?') or (href[:1] == '/' and href[1:2] != '/'):
+            return True
+        return urlsplit(absolute_url).netloc == base_domain
+
+    def _analyze_images(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Analyze image optimization."""
-        images = soup.find_all('img')
+        images = tags['img']
         image_analysis = []
+        alt_count = 0
+        dimensions_count = 0
         
         for img in images:
+            alt = img.get('alt', '')
+            has_alt = bool(alt)
+            has_dimensions = bool(img.get('width')) and bool(img.get('height'))
+            alt_count += has_alt
+            dimensions_count += has_dimensions
             image_analysis.append({
                 'src': img.get('src', ''),
-                'alt': img.get('alt', ''),
+                'alt': alt,
                 'title': img.get('title', ''),
-                'has_alt': bool(img.get('alt')),
-                'has_dimensions': bool(img.get('width')) and bool(img.get('height'))
+                'has_alt': has_alt,
+                'has_dimensions': has_dimensions
             })
         
         return {
             'total_images': len(images),
-            'images_with_alt': sum(1 for img in image_analysis if img['has_alt']),
-            'images_with_dimensions': sum(1 for img in image_analysis if img['has_dimensions']),
+            'images_with_alt': alt_count,
+            'images_with_dimensions': dimensions_count,
             'image_details': image_analysis
         }
 
-    def _analyze_technical_seo(self, soup: BeautifulSoup) -> Dict:
+    def _analyze_technical_seo(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Analyze technical SEO elements."""
         return {
-            'has_viewport': bool(soup.find('meta', attrs={'name': 'viewport'})),
-            'has_favicon': bool(soup.find('link', rel='icon') or soup.find('link', rel='shortcut icon')),
-            'has_structured_data': bool(soup.find('script', type='application/ld+json')),
-            'has_xml_sitemap': bool(soup.find('link', rel='sitemap')),
-            'has_robots_txt': bool(soup.find('meta', attrs={'name': 'robots'})),
-            'has_analytics': bool(soup.find('script', string=re.compile(r'gtag|ga|analytics')))
+            'has_viewport': self._find_meta(tags, 'name', 'viewport') is not None,
+            'has_favicon': self._find_link(tags, 'icon') is not None,
+            'has_structured_data': any(
+                script.get('type') == 'application/ld+json' for script in tags['script']
+            ),
+            'has_xml_sitemap': self._find_link(tags, 'sitemap') is not None,
+            'has_robots_txt': self._find_meta(tags, 'name', 'robots') is not None,
+            'has_analytics': any(
+                script.string is not None and _ANALYTICS_RE.search(script.string)
+                for script in tags['script']
+            )
         }
 
     def _analyze_url_structure(self, url: str) -> Dict:
         """Analyze URL structure and components."""
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         path_segments = [seg for seg in parsed.path.split('/') if seg]
         
         return {
@@ -171,9 +396,17 @@ class SEOAnalyzer:
             'is_clean_url': not bool(parsed.query) and not bool(parsed.fragment)
         }
 
-    def _get_title_info(self, soup: BeautifulSoup) -> Dict:
+    def _find_meta(self, tags: Dict[str, List[Tag]], attr: str, value: str) -> Optional[Tag]:
+        """Get the first meta tag whose attr equals value."""
+        return next((meta for meta in tags['meta'] if meta.get(attr) == value), None)
+
+    def _find_link(self, tags: Dict[str, List[Tag]], rel: str) -> Optional[Tag]:
+        """Get the first link tag with the given rel value."""
+        return next((link for link in tags['link'] if rel in link.get('rel', ())), None)
+
+    def _get_title_info(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Get detailed title tag information."""
-        title_tag = soup.find('title')
+        title_tag = tags['title'][0] if tags['title'] else None
         if not title_tag:
             return {'found': False, 'content': '', 'length': 0}
         
@@ -184,9 +417,9 @@ class SEOAnalyzer:
             'length': len(content.strip())
         }
 
-    def _get_meta_description(self, soup: BeautifulSoup) -> Dict:
+    def _get_meta_description(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Get meta description information."""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._find_meta(tags, 'name', 'description')
         if not meta_desc:
             return {'found': False, 'content': '', 'length': 0}
         
@@ -197,45 +430,49 @@ class SEOAnalyzer:
             'length': len(content)
         }
 
-    def _get_meta_content(self, soup: BeautifulSoup, name: str) -> str:
+    def _get_meta_content(self, tags: Dict[str, List[Tag]], name: str) -> str:
         """Get content of a specific meta tag."""
-        meta_tag = soup.find('meta', attrs={'name': name})
+        meta_tag = self._find_meta(tags, 'name', name)
         return meta_tag.get('content', '') if meta_tag else ''
 
-    def _get_charset(self, soup: BeautifulSoup) -> str:
+    def _get_charset(self, tags: Dict[str, List[Tag]]) -> str:
         """Get document charset."""
         # Check meta charset
-        meta_charset = soup.find('meta', charset=True)
+        meta_charset = next((meta for meta in tags['meta'] if meta.get('charset') is not None), None)
         if meta_charset:
             return meta_charset.get('charset', '')
         
         # Check content-type meta
-        meta_content_type = soup.find('meta', attrs={'http-equiv': 'Content-Type'})
+        meta_content_type = self._find_meta(tags, 'http-equiv', 'Content-Type')
         if meta_content_type:
             content = meta_content_type.get('content', '')
-            match = re.search(r'charset=([^\s]*)', content)
+            match = _CHARSET_RE.search(content)
             if match:
                 return match.group(1)
         
         return ''
 
-    def _get_canonical_url(self, soup: BeautifulSoup) -> str:
+    def _get_canonical_url(self, tags: Dict[str, List[Tag]]) -> str:
         """Get canonical URL."""
-        canonical = soup.find('link', rel='canonical')
+        canonical = self._find_link(tags, 'canonical')
         return canonical.get('href', '') if canonical else ''
 
-    def _get_opengraph_tags(self, soup: BeautifulSoup) -> Dict:
+    def _get_opengraph_tags(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Get OpenGraph meta tags."""
         og_tags = {}
-        for tag in soup.find_all('meta', property=re.compile(r'^og:')):
-            og_tags[tag.get('property')] = tag.get('content', '')
+        for tag in tags['meta']:
+            prop = tag.get('property')
+            if prop is not None and prop.startswith('og:'):
+                og_tags[prop] = tag.get('content', '')
         return og_tags
 
-    def _get_twitter_cards(self, soup: BeautifulSoup) -> Dict:
+    def _get_twitter_cards(self, tags: Dict[str, List[Tag]]) -> Dict:
         """Get Twitter Card meta tags."""
         twitter_tags = {}
-        for tag in soup.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
-            twitter_tags[tag.get('name')] = tag.get('content', '')
+        for tag in tags['meta']:
+            name = tag.get('name')
+            if name is not None and name.startswith('twitter:'):
+                twitter_tags[name] = tag.get('content', '')
         return twitter_tags
 
     def _calculate_avg_length(self, elements) -> float:
@@ -245,8 +482,7 @@ class SEOAnalyzer:
         total_length = sum(len(elem.get_text().strip()) for elem in elements)
         return total_length / len(elements)
 
-    def _calculate_text_html_ratio(self, soup: BeautifulSoup) -> float:
-        """Calculate text to HTML ratio."""
-        text_length = len(soup.get_text())
-        html_length = len(str(soup))
+    def _calculate_text_html_ratio(self, text: str, html_length: int) -> float:
+        """Calculate text to HTML ratio against the size of the raw HTML as fetched."""
+        text_length = len(text)
         return (text_length / html_length) * 100 if html_length > 0 else 0 
\ No newline at end of file
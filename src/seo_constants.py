@@ -0,0 +1,15 @@
+"""
+Constants shared by the SEO analysis and metrics modules.
+"""
+
+# Most common English words, ignored when picking out page keywords
+STOP_WORDS = frozenset({
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at'
+})
+
+# Broader list used when scoring titles, descriptions and link text
+EXTENDED_STOP_WORDS = STOP_WORDS | frozenset({
+    'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
+    'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their', 'what'
+})
@@ -1,21 +1,84 @@
 """
 Advanced SEO metrics computation module.
 """
+import bisect
+import hashlib
+import logging
 import re
-from typing import Dict, List, Tuple
+import string
+from typing import Callable, Dict, List, Tuple
 from collections import Counter
+from functools import lru_cache
 import math
 
+from .seo_constants import EXTENDED_STOP_WORDS
+
+logger = logging.getLogger(__name__)
+
+# Keyword candidates: word runs of three or more characters, so the length
+# filter happens inside the regex
+_KEYWORD_RE = re.compile(r'\w{3,}')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_VOWEL_RUN_RE = re.compile(r'[aeiouy]+')
+
+# Lowest Flesch score of each readability level, in ascending order
+_LEVEL_THRESHOLDS = (0, 30, 50, 60, 70, 80, 90)
+_LEVEL_NAMES = ("Very Difficult", "Difficult", "Fairly Difficult", "Standard",
+                "Fairly Easy", "Easy", "Very Easy")
+
+@lru_cache(maxsize=16384)
+def _word_syllables(word: str) -> int:
+    """Count the syllables of a lowercased word, one per vowel group and at least one."""
+    # Words are whitespace-separated tokens, so surrounding punctuation is dropped
+    word = word.strip(string.punctuation)
+    syllables = len(_VOWEL_RUN_RE.findall(word))
+    # A final silent 'e' does not start a syllable of its own
+    if syllables > 1 and word.endswith('e'):
+        syllables -= 1
+    return syllables or 1
+
+@lru_cache(maxsize=128)
+def _make_normalizer(min_val: float, max_val: float) -> Callable[[float], float]:
+    """
+    Build a scorer that normalizes values to 0-1 against one ideal range.
+    
+    The range checks that do not depend on the value are settled here, once,
+    instead of on every call, and each range's scorer is built only once.
+    
+    Args:
+        min_val (float): Lower bound of the ideal range
+        max_val (float): Upper bound of the ideal range
+        
+    Returns:
+        Callable[[float], float]: Function mapping a value to its score
+    """
+    if min_val == max_val:
+        def normalize(value: float) -> float:
+            try:
+                return 0.0 if value == 0 else 1.0
+            except Exception:
+                return 0.0
+        return normalize
+    
+    def normalize(value: float) -> float:
+        try:
+            if value < min_val:
+                return value / min_val if min_val != 0 else 0.0
+            elif value > max_val:
+                return 1 - ((value - max_val) / max_val)
+            return 1.0
+        except Exception:
+            return 0.0
+    return normalize
+
 class SEOMetrics:
+    # Fixed attribute layout, without a per-instance __dict__
+    __slots__ = ('stop_words', 'ideal_ranges', '_norm', 'readability_cache_size', '_readability_cache')
+
     def __init__(self):
         """Initialize SEO metrics calculator."""
-        # Common English stop words
-        self.stop_words = {
-            'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-            'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
-            'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
-            'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their', 'what'
-        }
+        # Common English stop words, shared by every instance
+        self.stop_words = EXTENDED_STOP_WORDS
         
         # Ideal ranges for various metrics
         self.ideal_ranges = {
@@ -26,8 +89,20 @@ class SEOMetrics:
             'text_html_ratio': (15, 70),
             'heading_density': (0.1, 0.3),
             'link_density': (0.1, 0.3),
-            'image_density': (0.1, 0.3)
+            'image_density': (0.1, 0.3),
+            'paragraph_count': (3, 10),
+            'paragraph_length': (50, 150),
+            'link_text_length': (3, 10)
+        }
+        # One prebuilt scorer per ideal range, used in place of _normalize_score
+        self._norm = {
+            name: _make_normalizer(*bounds) for name, bounds in self.ideal_ranges.items()
         }
+        
+        # Readability depends only on the page text, which repeats across
+        # re-scored pages, so results are kept by a digest of that text
+        self.readability_cache_size = 1024
+        self._readability_cache: Dict[bytes, Dict] = {}
 
     def compute_metrics(self, seo_analysis: Dict) -> Dict:
         """
@@ -40,17 +115,30 @@ class SEOMetrics:
             Dict: Advanced SEO metrics
         """
         try:
+            content_quality = self._compute_content_quality(seo_analysis)
+            technical_score = self._compute_technical_score(seo_analysis)
+            readability = self._compute_readability(seo_analysis)
+            keyword_optimization = self._compute_keyword_optimization(seo_analysis)
+            link_quality = self._compute_link_quality(seo_analysis)
+            image_optimization = self._compute_image_optimization(seo_analysis)
+            
             return {
-                'content_quality': self._compute_content_quality(seo_analysis),
-                'technical_score': self._compute_technical_score(seo_analysis),
-                'readability': self._compute_readability(seo_analysis),
-                'keyword_optimization': self._compute_keyword_optimization(seo_analysis),
-                'link_quality': self._compute_link_quality(seo_analysis),
-                'image_optimization': self._compute_image_optimization(seo_analysis),
-                'overall_score': self._compute_overall_score(seo_analysis)
+                'content_quality': content_quality,
+                'technical_score': technical_score,
+                'readability': readability,
+                'keyword_optimization': keyword_optimization,
+                'link_quality': link_quality,
+                'image_optimization': image_optimization,
+                # Built from the sections above, not recomputed
+                'overall_score': self._compute_overall_score(
+                    content_quality, technical_score, keyword_optimization,
+                    link_quality, image_optimization
+                )
             }
         except Exception as e:
-            print(f"Warning: Error computing metrics: {str(e)}")
+            # Any section failing falls back to the defaults for the whole
+            # result; the message is only formatted when debug logging is on
+            logger.debug("Error computing metrics: %s", e)
             return self._get_default_metrics()
 
     def _get_default_metrics(self) -> Dict:
@@ -105,231 +193,208 @@ class SEOMetrics:
 
     def _compute_content_quality(self, analysis: Dict) -> Dict:
         """Compute content quality metrics."""
-        try:
-            content = analysis['content_analysis']
-            meta = analysis['meta_tags']
-            
-            # Calculate content length score
-            content_length = content.get('content_length', 0)
-            content_length_score = self._normalize_score(
-                content_length,
-                self.ideal_ranges['content_length'][0],
-                self.ideal_ranges['content_length'][1]
-            )
-            
-            # Calculate heading structure score
-            headings = content.get('heading_structure', {})
-            heading_score = self._calculate_heading_score(headings)
-            
-            # Calculate paragraph structure score
-            paragraph_score = self._calculate_paragraph_score(content)
-            
-            return {
-                'content_length_score': content_length_score,
-                'heading_structure_score': heading_score,
-                'paragraph_structure_score': paragraph_score,
-                'text_html_ratio_score': self._normalize_score(
-                    content.get('text_html_ratio', 0),
-                    self.ideal_ranges['text_html_ratio'][0],
-                    self.ideal_ranges['text_html_ratio'][1]
-                ),
-                'overall_content_score': (content_length_score + heading_score + paragraph_score) / 3
-            }
-        except Exception as e:
-            print(f"Warning: Error computing content quality: {str(e)}")
-            return self._get_default_metrics()['content_quality']
+        content = analysis['content_analysis']
+        meta = analysis['meta_tags']
+        
+        # Calculate content length score
+        content_length = content.get('content_length', 0)
+        content_length_score = self._norm['content_length'](content_length)
+        
+        # Calculate heading structure score
+        headings = content.get('heading_structure', {})
+        heading_score = self._calculate_heading_score(headings)
+        
+        # Calculate paragraph structure score
+        paragraph_score = self._calculate_paragraph_score(content)
+        
+        return {
+            'content_length_score': content_length_score,
+            'heading_structure_score': heading_score,
+            'paragraph_structure_score': paragraph_score,
+            'text_html_ratio_score': self._norm['text_html_ratio'](content.get('text_html_ratio', 0)),
+            'overall_content_score': (content_length_score + heading_score + paragraph_score) / 3
+        }
 
     def _compute_technical_score(self, analysis: Dict) -> Dict:
         """Compute technical SEO score."""
-        try:
-            technical = analysis['technical_seo']
-            meta = analysis['meta_tags']
-            
-            # Calculate meta tags score
-            meta_score = self._calculate_meta_score(meta)
-            
-            # Calculate technical elements score
-            technical_elements = {
-                'viewport': technical['has_viewport'],
-                'favicon': technical['has_favicon'],
-                'structured_data': technical['has_structured_data'],
-                'analytics': technical['has_analytics'],
-                'robots_txt': technical['has_robots_txt']
-            }
-            
-            technical_score = sum(technical_elements.values()) / len(technical_elements)
-            
-            return {
-                'meta_tags_score': meta_score,
-                'technical_elements_score': technical_score,
-                'overall_technical_score': (meta_score + technical_score) / 2
-            }
-        except Exception as e:
-            print(f"Warning: Error computing technical score: {str(e)}")
-            return self._get_default_metrics()['technical_score']
+        technical = analysis['technical_seo']
+        meta = analysis['meta_tags']
+        
+        # Calculate meta tags score
+        meta_score = self._calculate_meta_score(meta)
+        
+        # Calculate technical elements score
+        technical_elements = {
+            'viewport': technical['has_viewport'],
+            'favicon': technical['has_favicon'],
+            'structured_data': technical['has_structured_data'],
+            'analytics': technical['has_analytics'],
+            'robots_txt': technical['has_robots_txt']
+        }
+        
+        technical_score = sum(technical_elements.values()) / len(technical_elements)
+        
+        return {
+            'meta_tags_score': meta_score,
+            'technical_elements_score': technical_score,
+            'overall_technical_score': (meta_score + technical_score) / 2
+        }
 
     def _compute_readability(self, analysis: Dict) -> Dict:
         """Compute readability metrics."""
-        try:
-            content = analysis['content_analysis']
-            text = content.get('main_content', '')
-            
-            # Calculate basic readability metrics
-            sentences = len(re.split(r'[.!?]+', text))
-            words = len(text.split())
-            syllables = self._count_syllables(text)
-            
-            # Calculate Flesch Reading Ease score
-            if sentences > 0 and words > 0:
-                flesch_score = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
-            else:
-                flesch_score = 0
-            
-            # Calculate average sentence length
-            avg_sentence_length = words / sentences if sentences > 0 else 0
-            
-            return {
-                'flesch_reading_ease': flesch_score,
-                'avg_sentence_length': avg_sentence_length,
-                'avg_word_length': sum(len(word) for word in text.split()) / words if words > 0 else 0,
-                'readability_level': self._get_readability_level(flesch_score)
-            }
-        except Exception as e:
-            print(f"Warning: Error computing readability: {str(e)}")
-            return self._get_default_metrics()['readability']
+        content = analysis['content_analysis']
+        text = content.get('main_content', '')
+        
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        readability = self._readability_cache.get(key)
+        if readability is None:
+            readability = self._text_readability(text)
+            if len(self._readability_cache) < self.readability_cache_size:
+                self._readability_cache[key] = readability
+        # Hand out a copy so callers cannot alter the cached entry
+        return dict(readability)
+
+    def _text_readability(self, text: str) -> Dict:
+        """Compute readability metrics for a page's text."""
+        # Calculate basic readability metrics
+        sentences = len(_SENT_SPLIT_RE.split(text))
+        tokens = text.split()
+        words = len(tokens)
+        syllables = self._count_syllables(text)
+        
+        # Calculate Flesch Reading Ease score
+        if sentences > 0 and words > 0:
+            flesch_score = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
+        else:
+            flesch_score = 0
+        
+        # Calculate average sentence length
+        avg_sentence_length = words / sentences if sentences > 0 else 0
+        
+        return {
+            'flesch_reading_ease': flesch_score,
+            'avg_sentence_length': avg_sentence_length,
+            'avg_word_length': sum(map(len, tokens)) / words if words > 0 else 0,
+            'readability_level': self._get_readability_level(flesch_score)
+        }
 
     def _compute_keyword_optimization(self, analysis: Dict) -> Dict:
         """Compute keyword optimization metrics."""
-        try:
-            keywords = analysis['keyword_analysis']
-            meta = analysis['meta_tags']
-            
-            # Calculate keyword density scores
-            density_scores = {}
-            for word, data in keywords.get('top_keywords', {}).items():
-                density_scores[word] = self._normalize_score(
-                    data['density'],
-                    self.ideal_ranges['keyword_density'][0],
-                    self.ideal_ranges['keyword_density'][1]
-                )
-            
-            # Calculate keyword presence in title and meta description
-            title_keywords = self._get_keywords_in_text(meta.get('title', {}).get('content', ''))
-            meta_keywords = self._get_keywords_in_text(meta.get('meta_description', {}).get('content', ''))
-            
-            return {
-                'keyword_density_scores': density_scores,
-                'keywords_in_title': title_keywords,
-                'keywords_in_meta': meta_keywords,
-                'keyword_optimization_score': sum(density_scores.values()) / len(density_scores) if density_scores else 0
-            }
-        except Exception as e:
-            print(f"Warning: Error computing keyword optimization: {str(e)}")
-            return self._get_default_metrics()['keyword_optimization']
+        keywords = analysis['keyword_analysis']
+        meta = analysis['meta_tags']
+        
+        # Calculate keyword density scores
+        normalize_density = self._norm['keyword_density']
+        density_scores = {
+            word: normalize_density(data['density'])
+            for word, data in keywords.get('top_keywords', {}).items()
+        }
+        
+        # Calculate keyword presence in title and meta description
+        title_keywords = self._get_keywords_in_text(meta.get('title', {}).get('content', ''))
+        meta_keywords = self._get_keywords_in_text(meta.get('meta_description', {}).get('content', ''))
+        
+        return {
+            'keyword_density_scores': density_scores,
+            'keywords_in_title': title_keywords,
+            'keywords_in_meta': meta_keywords,
+            'keyword_optimization_score': sum(density_scores.values()) / len(density_scores) if density_scores else 0
+        }
 
     def _compute_link_quality(self, analysis: Dict) -> Dict:
         """Compute link quality metrics."""
-        try:
-            links = analysis['link_analysis']
-            
-            # Calculate internal/external link ratio
-            total_links = links['internal_links']['count'] + links['external_links']['count']
-            internal_ratio = links['internal_links']['count'] / total_links if total_links > 0 else 0
-            
-            # Calculate link text quality
-            internal_links = links['internal_links']['links']
-            external_links = links['external_links']['links']
-            
-            internal_text_score = self._calculate_link_text_score(internal_links)
-            external_text_score = self._calculate_link_text_score(external_links)
-            
-            return {
-                'internal_external_ratio': internal_ratio,
-                'internal_link_text_score': internal_text_score,
-                'external_link_text_score': external_text_score,
-                'overall_link_quality_score': (internal_text_score + external_text_score) / 2
-            }
-        except Exception as e:
-            print(f"Warning: Error computing link quality: {str(e)}")
-            return self._get_default_metrics()['link_quality']
+        links = analysis['link_analysis']
+        
+        # Calculate internal/external link ratio
+        total_links = links['internal_links']['count'] + links['external_links']['count']
+        internal_ratio = links['internal_links']['count'] / total_links if total_links > 0 else 0
+        
+        # Calculate link text quality
+        internal_links = links['internal_links']['links']
+        external_links = links['external_links']['links']
+        
+        internal_text_score = self._calculate_link_text_score(internal_links)
+        external_text_score = self._calculate_link_text_score(external_links)
+        
+        return {
+            'internal_external_ratio': internal_ratio,
+            'internal_link_text_score': internal_text_score,
+            'external_link_text_score': external_text_score,
+            'overall_link_quality_score': (internal_text_score + external_text_score) / 2
+        }
 
     def _compute_image_optimization(self, analysis: Dict) -> Dict:
         """Compute image optimization metrics."""
-        try:
-            images = analysis['image_analysis']
-            
-            # Calculate image optimization scores
-            total_images = images.get('total_images', 0)
-            if total_images > 0:
-                alt_text_score = images['images_with_alt'] / total_images
-                dimensions_score = images['images_with_dimensions'] / total_images
-            else:
-                alt_text_score = 0
-                dimensions_score = 0
-            
-            return {
-                'alt_text_score': alt_text_score,
-                'dimensions_score': dimensions_score,
-                'overall_image_score': (alt_text_score + dimensions_score) / 2
-            }
-        except Exception as e:
-            print(f"Warning: Error computing image optimization: {str(e)}")
-            return self._get_default_metrics()['image_optimization']
+        images = analysis['image_analysis']
+        
+        # Calculate image optimization scores
+        total_images = images.get('total_images', 0)
+        if total_images > 0:
+            alt_text_score = images['images_with_alt'] / total_images
+            dimensions_score = images['images_with_dimensions'] / total_images
+        else:
+            alt_text_score = 0
+            dimensions_score = 0
+        
+        return {
+            'alt_text_score': alt_text_score,
+            'dimensions_score': dimensions_score,
+            'overall_image_score': (alt_text_score + dimensions_score) / 2
+        }
 
-    def _compute_overall_score(self, analysis: Dict) -> Dict:
-        """Compute overall SEO score."""
-        try:
-            content_quality = self._compute_content_quality(analysis)['overall_content_score']
-            technical_score = self._compute_technical_score(analysis)['overall_technical_score']
-            keyword_score = self._compute_keyword_optimization(analysis)['keyword_optimization_score']
-            link_score = self._compute_link_quality(analysis)['overall_link_quality_score']
-            image_score = self._compute_image_optimization(analysis)['overall_image_score']
-            
-            # Weighted average of all scores
-            weights = {
-                'content': 0.3,
-                'technical': 0.2,
-                'keyword': 0.2,
-                'link': 0.15,
-                'image': 0.15
-            }
-            
-            overall_score = (
-                content_quality * weights['content'] +
-                technical_score * weights['technical'] +
-                keyword_score * weights['keyword'] +
-                link_score * weights['link'] +
-                image_score * weights['image']
-            )
+    def _compute_overall_score(self, content: Dict, technical: Dict, keywords: Dict,
+                               links: Dict, images: Dict) -> Dict:
+        """
+        Compute overall SEO score from the already computed metric sections.
+        
+        Args:
+            content (Dict): Result of _compute_content_quality
+            technical (Dict): Result of _compute_technical_score
+            keywords (Dict): Result of _compute_keyword_optimization
+            links (Dict): Result of _compute_link_quality
+            images (Dict): Result of _compute_image_optimization
             
-            return {
-                'overall_score': overall_score,
-                'score_breakdown': {
-                    'content_quality': content_quality,
-                    'technical_score': technical_score,
-                    'keyword_score': keyword_score,
-                    'link_score': link_score,
-                    'image_score': image_score
-                }
+        Returns:
+            Dict: Weighted overall score and its breakdown
+        """
+        content_quality = content['overall_content_score']
+        technical_score = technical['overall_technical_score']
+        keyword_score = keywords['keyword_optimization_score']
+        link_score = links['overall_link_quality_score']
+        image_score = images['overall_image_score']
+        
+        # Weighted average of all scores
+        weights = {
+            'content': 0.3,
+            'technical': 0.2,
+            'keyword': 0.2,
+            'link': 0.15,
+            'image': 0.15
+        }
+        
+        overall_score = (
+            content_quality * weights['content'] +
+            technical_score * weights['technical'] +
+            keyword_score * weights['keyword'] +
+            link_score * weights['link'] +
+            image_score * weights['image']
+        )
+        
+        return {
+            'overall_score': overall_score,
+            'score_breakdown': {
+                'content_quality': content_quality,
+                'technical_score': technical_score,
+                'keyword_score': keyword_score,
+                'link_score': link_score,
+                'image_score': image_score
             }
-        except Exception as e:
-            print(f"Warning: Error computing overall score: {str(e)}")
-            return self._get_default_metrics()['overall_score']
+        }
 
-    def _normalize_score(self, value: float, min_val: float, max_val: float) -> float:
+    @staticmethod
+    def _normalize_score(value: float, min_val: float, max_val: float) -> float:
         """Normalize a value to a 0-1 score based on ideal range."""
-        try:
-            # Handle edge cases
-            if min_val == max_val:
-                return 0.0 if value == 0 else 1.0
-                
-            if value < min_val:
-                return value / min_val if min_val != 0 else 0.0
-            elif value > max_val:
-                return 1 - ((value - max_val) / max_val)
-            return 1.0
-        except Exception:
-            return 0.0
+        return _make_normalizer(min_val, max_val)(value)
 
     def _calculate_heading_score(self, headings: Dict) -> float:
         """Calculate heading structure score."""
@@ -344,11 +409,7 @@ class SEOMetrics:
             
             # Score based on presence and hierarchy
             hierarchy_score = 1.0 if has_h1 and has_h2 else 0.5
-            density_score = self._normalize_score(
-                heading_density,
-                self.ideal_ranges['heading_density'][0],
-                self.ideal_ranges['heading_density'][1]
-            )
+            density_score = self._norm['heading_density'](heading_density)
             
             return (hierarchy_score + density_score) / 2
         except Exception:
@@ -361,8 +422,8 @@ class SEOMetrics:
             avg_length = content.get('avg_paragraph_length', 0)
             
             # Score based on paragraph count and average length
-            count_score = self._normalize_score(paragraph_count, 3, 10)
-            length_score = self._normalize_score(avg_length, 50, 150)
+            count_score = self._norm['paragraph_count'](paragraph_count)
+            length_score = self._norm['paragraph_length'](avg_length)
             
             return (count_score + length_score) / 2
         except Exception:
@@ -375,72 +436,49 @@ class SEOMetrics:
             description = meta.get('meta_description', {})
             
             # Score title
-            title_score = self._normalize_score(
-                title.get('length', 0),
-                self.ideal_ranges['title_length'][0],
-                self.ideal_ranges['title_length'][1]
+            title_score = self._norm['title_length'](
+                title.get('length', 0)
             ) if title.get('found', False) else 0
             
             # Score description
-            desc_score = self._normalize_score(
-                description.get('length', 0),
-                self.ideal_ranges['meta_description_length'][0],
-                self.ideal_ranges['meta_description_length'][1]
+            desc_score = self._norm['meta_description_length'](
+                description.get('length', 0)
             ) if description.get('found', False) else 0
             
             return (title_score + desc_score) / 2
         except Exception:
             return 0.0
 
-    def _count_syllables(self, text: str) -> int:
-        """Count syllables in text."""
+    @staticmethod
+    def _count_syllables(text: str) -> int:
+        """Count syllables in text, one vowel group per syllable and at least one per word."""
         try:
-            count = 0
-            vowels = 'aeiouy'
-            text = text.lower()
-            
-            for word in text.split():
-                if word[0] in vowels:
-                    count += 1
-                for i in range(1, len(word)):
-                    if word[i] in vowels and word[i-1] not in vowels:
-                        count += 1
-                if word.endswith('e'):
-                    count -= 1
-                if count == 0:
-                    count += 1
-                    
-            return count
+            # Words are split as the readability word count splits them.
+            # Word frequencies are Zipfian, so each distinct word is counted
+            # once (and memoized across pages) and weighted by its frequency
+            word_counts = Counter(text.lower().split())
+            return sum(_word_syllables(word) * count for word, count in word_counts.items())
         except Exception:
             return 0
 
-    def _get_readability_level(self, flesch_score: float) -> str:
+    @staticmethod
+    def _get_readability_level(flesch_score: float) -> str:
         """Get readability level based on Flesch score."""
         try:
-            if flesch_score >= 90:
-                return "Very Easy"
-            elif flesch_score >= 80:
-                return "Easy"
-            elif flesch_score >= 70:
-                return "Fairly Easy"
-            elif flesch_score >= 60:
-                return "Standard"
-            elif flesch_score >= 50:
-                return "Fairly Difficult"
-            elif flesch_score >= 30:
-                return "Difficult"
-            elif flesch_score >= 0:
-                return "Very Difficult"
-            else:
+            # Negative and NaN scores have no level
+            if not flesch_score >= 0:
                 return "Unknown"
+            return _LEVEL_NAMES[bisect.bisect_right(_LEVEL_THRESHOLDS, flesch_score) - 1]
         except Exception:
             return "Unknown"
 
     def _get_keywords_in_text(self, text: str) -> List[str]:
         """Extract keywords from text."""
         try:
-            words = re.findall(r'\w+', text.lower())
-            return [word for word in words if word not in self.stop_words and len(word) > 2]
+            if not text:
+                return []
+            stop_words = self.stop_words
+            return [word for word in _KEYWORD_RE.findall(text.lower()) if word not in stop_words]
         except Exception:
             return []
 
@@ -450,14 +488,18 @@ class SEOMetrics:
             if not links:
                 return 0
                 
-            scores = []
+            normalize_length = self._norm['link_text_length']
+            # A link has a keyword unless every word is a stop word, which the
+            # set checks in one C-level issuperset call
+            is_stop_only = self.stop_words.issuperset
+            total = 0.0
             for link in links:
                 text = link.get('text', '')
                 # Score based on text length and presence of keywords
-                length_score = self._normalize_score(len(text), 3, 10)
-                keyword_score = 1.0 if any(word not in self.stop_words for word in text.split()) else 0.5
-                scores.append((length_score + keyword_score) / 2)
+                length_score = normalize_length(len(text))
+                keyword_score = 0.5 if is_stop_only(text.split()) else 1.0
+                total += (length_score + keyword_score) / 2
                 
-            return sum(scores) / len(scores)
+            return total / len(links)
         except Exception:
             return 0.0 
\ No newline at end of file
@@ -3,7 +3,6 @@ Tests for AIReadabilityAnalyzer (SEO Structure Metrics)
 """
 import pytest
 from src.ai_readability import AIReadabilityAnalyzer
-from unittest.mock import patch
 
 @pytest.fixture
 def analyzer():
@@ -115,13 +114,17 @@ def test_semantic_element_usage_suboptimal(analyzer):
 
 def test_html_validation_errors_none(analyzer):
     html = "<html><body><p>Valid HTML</p></body></html>"
-    with patch('html5lib.HTMLParser') as mock_parser:
-        mock_parser.return_value.parse.return_value = None
-        mock_parser.return_value.errors = []
-        result = analyzer.analyze_semantic_and_structure(html, {})
-        assert result['html_validation_errors']['optimal'] is True
-        assert result['html_validation_errors']['error_count'] == 0
-        assert 'Optimal' in result['html_validation_errors']['explanation']
+    result = analyzer.analyze_semantic_and_structure(html, {})
+    assert result['html_validation_errors']['optimal'] is True
+    assert result['html_validation_errors']['error_count'] == 0
+    assert 'Optimal' in result['html_validation_errors']['explanation']
+
+def test_html_validation_tolerates_void_and_optional_end_tags(analyzer):
+    html = "<html><body><ul><li>One<li>Two</ul><br><img src='a.png'><p>Text</body></html>"
+    result = analyzer.analyze_semantic_and_structure(html, {})
+    assert result['html_validation_errors']['error_count'] == 0
+    result = analyzer.analyze_semantic_and_structure("<div><span></div></span>", {})
+    assert result['html_validation_errors']['error_count'] == 2
 
 def test_html_validation_errors_present(analyzer):
     html = html_sample(valid=False)
@@ -2,6 +2,8 @@
 Tests for the crawlability analyzer module.
 """
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
 from src.crawlability import CrawlabilityAnalyzer
 
 @pytest.fixture
@@ -266,4 +268,158 @@ def test_get_explanations(analyzer):
     assert "Excellent" in analyzer._get_overall_score_explanation(0.9)
     assert "Good" in analyzer._get_overall_score_explanation(0.7)
     assert "Fair" in analyzer._get_overall_score_explanation(0.5)
-    assert "Poor" in analyzer._get_overall_score_explanation(0.3) 
\ No newline at end of file
+    assert "Poor" in analyzer._get_overall_score_explanation(0.3)
+
+def test_robots_txt_fetch_is_cached(analyzer, sample_robots_txt, mocker):
+    """Test robots.txt is fetched once per site within the cache TTL."""
+    mock_get = mocker.patch.object(analyzer._session, 'get')
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.text = sample_robots_txt
+
+    first = analyzer._analyze_llm_bot_directives("https://example.com")
+    second = analyzer._analyze_llm_bot_directives("https://example.com")
+
+    assert mock_get.call_count == 1
+    assert first["robots_txt_exists"] is True
+    assert first["bot_directives"] == second["bot_directives"]
+
+def test_fetch_cache_is_bounded(analyzer, mocker):
+    """Test only the most recently used site resources are kept."""
+    mock_get = mocker.patch.object(analyzer._session, 'get')
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.content = b"<urlset/>"
+    analyzer.fetch_cache_size = 2
+
+    for url in ("https://a.com/sitemap.xml", "https://b.com/sitemap.xml",
+                "https://a.com/sitemap.xml", "https://c.com/sitemap.xml"):
+        analyzer._fetch_cached(analyzer._sitemap_cache, url, 'content')
+
+    assert mock_get.call_count == 3
+    assert list(analyzer._sitemap_cache) == ["https://a.com/sitemap.xml", "https://c.com/sitemap.xml"]
+
+def test_robots_txt_sections_reused(analyzer, sample_robots_txt):
+    """Test robots.txt is scanned once when several bots are checked against it."""
+    sections = analyzer._extract_user_agent_sections(sample_robots_txt)
+    assert analyzer._extract_user_agent_sections(sample_robots_txt) is sections
+    assert analyzer._extract_user_agent_sections("User-agent: *\nDisallow: /") == {}
+    assert analyzer._extract_user_agent_sections(sample_robots_txt) == sections
+
+def test_analyze_crawlability_combines_probes(analyzer, sample_html, mocker):
+    """Test the full analysis collects every probe result."""
+    mocker.patch.object(analyzer, '_check_sitemap_inclusion', return_value={
+        "sitemap_exists": True, "url_in_sitemap": True,
+        "sitemap_url": "https://example.com/sitemap.xml", "explanation": ""
+    })
+    mocker.patch.object(analyzer, '_measure_load_time', return_value={
+        "load_time": 0.5, "is_optimal": True, "status_code": 200, "explanation": ""
+    })
+    mocker.patch.object(analyzer, '_analyze_llm_bot_directives', return_value={
+        "robots_txt_exists": False, "robots_txt_url": "https://example.com/robots.txt",
+        "bot_directives": {}, "summary": "No robots.txt found"
+    })
+
+    result = analyzer.analyze_crawlability("https://example.com/page", sample_html)
+
+    assert result["indexability"]["is_indexable"] is True
+    assert result["sitemap_status"]["url_in_sitemap"] is True
+    assert result["load_time"]["load_time"] == 0.5
+    assert result["llm_bot_analysis"]["robots_txt_exists"] is False
+    assert 0 <= result["overall_score"]["score"] <= 1
+
+def test_analyze_crawlability_uses_given_executor(sample_html, mocker):
+    """Test the network probes run on an injected executor, which is left open."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        analyzer = CrawlabilityAnalyzer(executor=executor)
+        submit = mocker.spy(executor, 'submit')
+        mocker.patch.object(analyzer, '_check_sitemap_inclusion', return_value={"sitemap_exists": False, "url_in_sitemap": False})
+        mocker.patch.object(analyzer, '_measure_load_time', return_value={"load_time": None, "is_optimal": False})
+        mocker.patch.object(analyzer, '_analyze_llm_bot_directives', return_value={"robots_txt_exists": False, "bot_directives": {}})
+
+        analyzer.analyze_crawlability("https://example.com/page", sample_html)
+
+        assert submit.call_count == 3
+        assert executor.submit(lambda: 1).result() == 1
+
+def test_calculate_text_ratio_counts_utf8_bytes(analyzer):
+    """Test text and HTML sizes are measured in UTF-8 bytes."""
+    result = analyzer._calculate_text_ratio("<p>café</p>")
+
+    assert result["text_bytes"] == 5
+    assert result["html_bytes"] == 12
+
+def test_check_sitemap_inclusion_follows_sitemap_index(analyzer, mocker):
+    """Test URLs listed in a child sitemap of a sitemap index are found."""
+    sitemaps = {
+        "https://example.com/sitemap.xml": b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-pages.xml</loc></sitemap>
+</sitemapindex>""",
+        "https://example.com/sitemap-pages.xml": b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/</loc></url>
+  <url><loc>https://example.com/page</loc></url>
+</urlset>""",
+    }
+
+    def fake_get(url, timeout):
+        return mocker.Mock(status_code=200, content=sitemaps[url])
+
+    mocker.patch.object(analyzer._session, 'get', side_effect=fake_get)
+
+    result = analyzer._check_sitemap_inclusion("https://example.com/page", "https://example.com")
+
+    assert result["sitemap_exists"] is True
+    assert result["url_in_sitemap"] is True
+
+def test_measure_load_time_streams_first_byte(analyzer, mocker):
+    """Test load time is measured without downloading the whole body."""
+    mock_get = mocker.patch.object(analyzer._session, 'get')
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.iter_content.return_value = iter([b'<'])
+
+    result = analyzer._measure_load_time("https://example.com")
+
+    mock_get.assert_called_once_with("https://example.com", timeout=10, stream=True)
+    mock_get.return_value.close.assert_called_once()
+    assert result["status_code"] == 200
+    assert result["is_optimal"] is True
+
+def test_scan_sitemap_matches_exact_urls(analyzer):
+    """Test sitemap matching ignores trailing slashes but not URL prefixes."""
+    sitemap = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc> https://example.com/foobar </loc></url>
+  <url><loc>https://example.com/docs/</loc></url>
+</urlset>"""
+
+    assert analyzer._scan_sitemap(sitemap, "https://example.com/foo") is False
+    assert analyzer._scan_sitemap(sitemap, "https://example.com/foobar") is True
+    assert analyzer._scan_sitemap(sitemap, "https://example.com/docs") is True
+
+def test_calculate_text_ratio_accepts_bytes(analyzer, sample_html):
+    """Test a raw response body gives the same ratio as decoded HTML."""
+    from_bytes = analyzer._calculate_text_ratio(sample_html.encode('utf-8'))
+    from_str = analyzer._calculate_text_ratio(sample_html)
+
+    assert from_bytes["html_bytes"] == from_str["html_bytes"]
+    assert from_bytes["text_bytes"] == from_str["text_bytes"]
+
+def test_calculate_text_ratio_keeps_bare_less_than(analyzer):
+    """Test a '<' that does not open a tag is counted as text."""
+    html_content = "<html><body><p>a < b and c > d</p><p>next</p></body></html>"
+    expected = BeautifulSoup(html_content, 'lxml').get_text(separator=' ', strip=True)
+
+    result = analyzer._calculate_text_ratio(html_content)
+
+    assert result["text_bytes"] == len(expected.encode('utf-8'))
+
+def test_analyze_crawlability_reuses_result_for_same_content(analyzer, sample_html, mocker):
+    """Test an unchanged page is not re-analyzed."""
+    analyze = mocker.patch.object(analyzer, '_analyze_uncached', return_value={"overall_score": {}})
+
+    first = analyzer.analyze_crawlability("https://example.com/page", sample_html)
+    first["overall_score"]["score"] = 0
+    second = analyzer.analyze_crawlability("https://example.com/page", sample_html)
+    analyzer.analyze_crawlability("https://example.com/page", sample_html + "<p>changed</p>")
+
+    assert second == {"overall_score": {}}
+    assert analyze.call_count == 2
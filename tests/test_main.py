@@ -0,0 +1,25 @@
+"""
+Tests for the GeoSearch entry point.
+"""
+import pytest
+from src.main import GeoSearch
+
+@pytest.fixture
+def geo_search():
+    # The analyzers are not needed to schedule URLs, so __init__ is skipped
+    return GeoSearch.__new__(GeoSearch)
+
+def test_analyze_urls(geo_search, mocker):
+    """Test that URLs are analyzed concurrently and results keep URL order."""
+    mocker.patch.object(geo_search, 'analyze_url', side_effect=lambda url: {"url": url})
+    urls = ["http://a.com", "http://b.com", "http://c.com"]
+    assert geo_search.analyze_urls(urls) == [{"url": url} for url in urls]
+
+def test_analyze_urls_reports_failures(geo_search, mocker):
+    """Test that a failing URL gives an error result instead of raising."""
+    mocker.patch.object(geo_search, 'analyze_url', side_effect=Exception("boom"))
+    assert geo_search.analyze_urls(["http://a.com"]) == [{"url": "http://a.com", "error": "boom"}]
+
+def test_analyze_urls_empty(geo_search):
+    """Test that no URLs give no results."""
+    assert geo_search.analyze_urls([]) == []
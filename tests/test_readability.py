@@ -2,7 +2,7 @@
 Tests for the readability analyzer module.
 """
 import pytest
-from src.readability import ReadabilityAnalyzer
+from src.readability import PARALLEL_THRESHOLD, ReadabilityAnalyzer
 
 @pytest.fixture
 def analyzer():
@@ -32,11 +32,27 @@ def test_count_syllables(analyzer):
     assert analyzer._count_syllables("sophisticated") == 5
     assert analyzer._count_syllables("comprehensive") == 4
 
+def test_count_syllables_empty_word(analyzer):
+    """Test that an empty token has no syllables instead of raising."""
+    assert analyzer._count_syllables("") == 0
+
+def test_collect_stats_skips_punctuation(analyzer):
+    """Test that tokens not starting with a letter are not counted as words."""
+    stats = analyzer._collect_stats(["' test , ."])
+    assert stats.word_count == 1
+    assert stats.total_syllables == 1
+
+def test_count_syllables_is_memoized(analyzer):
+    """Test that syllable counts are cached per lowercased word."""
+    assert analyzer._count_syllables("Testing") == 2
+    assert analyzer._syllable_cache["testing"] == 2
+    analyzer._syllable_cache["testing"] = 7
+    assert analyzer._count_syllables("TESTING") == 7
+
 def test_calculate_flesch_score(analyzer):
     """Test Flesch Reading Ease score calculation."""
-    text = "This is a simple test. It has two sentences."
-    words = text.split()
-    score = analyzer._calculate_flesch_score(text, words)
+    stats = analyzer._collect_stats(["This is a simple test.", "It has two sentences."])
+    score = analyzer._calculate_flesch_score(stats)
     assert isinstance(score, dict)
     assert 'score' in score
     assert 'explanation' in score
@@ -45,9 +61,8 @@ def test_calculate_flesch_score(analyzer):
 
 def test_calculate_avg_sentence_length(analyzer):
     """Test average sentence length calculation."""
-    text = "First sentence. Second sentence. Third sentence."
-    words = text.split()
-    avg_length = analyzer._calculate_avg_sentence_length(text, words)
+    stats = analyzer._collect_stats(["First sentence.", "Second sentence.", "Third sentence."])
+    avg_length = analyzer._calculate_avg_sentence_length(stats)
     assert isinstance(avg_length, dict)
     assert 'avg_length' in avg_length
     assert isinstance(avg_length['avg_length'], float)
@@ -55,8 +70,8 @@ def test_calculate_avg_sentence_length(analyzer):
 
 def test_calculate_lexical_complexity(analyzer):
     """Test lexical complexity calculation."""
-    text = "Simple words and sophisticated vocabulary."
-    complexity = analyzer._calculate_lexical_complexity(text)
+    stats = analyzer._collect_stats(["Simple words and sophisticated vocabulary."])
+    complexity = analyzer._calculate_lexical_complexity(stats)
     assert isinstance(complexity, dict)
     assert 'complex_percentage' in complexity
     assert 'complex_words' in complexity
@@ -64,6 +79,14 @@ def test_calculate_lexical_complexity(analyzer):
     assert isinstance(complexity['complex_percentage'], float)
     assert 0 <= complexity['complex_percentage'] <= 100
 
+def test_collect_stats(analyzer):
+    """Test single-pass word, syllable and sentence statistics."""
+    stats = analyzer._collect_stats(["This is a test.", "Sophisticated words appear here."])
+    assert stats.sentence_count == 2
+    assert stats.word_count == 8
+    assert stats.optimal_sentences == 2
+    assert stats.complex_words == 1
+
 def test_analyze_readability(analyzer, sample_text):
     """Test complete readability analysis."""
     results = analyzer.analyze_readability(sample_text)
@@ -105,6 +128,31 @@ def test_analyze_readability(analyzer, sample_text):
     assert isinstance(overall['score'], float)
     assert 0 <= overall['score'] <= 1
 
+def test_text_stats_can_be_reused(analyzer, sample_text):
+    """Test that metrics computed from collected stats match a full analysis."""
+    stats = analyzer.text_stats(sample_text)
+    assert analyzer.analyze_stats(stats) == analyzer.analyze_readability(sample_text)
+    assert analyzer.text_stats("<p> 42 </p>").word_count == 0
+
+def test_analyze_readability_is_cached(analyzer, sample_text, mocker):
+    """Test that repeated texts are analyzed once and callers get independent copies."""
+    spy = mocker.spy(analyzer, 'text_stats')
+    first = analyzer.analyze_readability(sample_text)
+    first['overall_score']['score'] = -1
+    first['overall_score']['components']['flesch'] = -1
+    second = analyzer.analyze_readability(sample_text)
+    assert spy.call_count == 1
+    assert second['overall_score']['score'] != -1
+    assert second['overall_score']['components']['flesch'] != -1
+    analyzer.analyze_readability("<p>Other text.</p>")
+    assert spy.call_count == 2
+
+def test_analyze_batch(analyzer, sample_text):
+    """Test that batch analysis matches analyzing each text on its own."""
+    expected = analyzer.analyze_readability(sample_text)
+    assert analyzer.analyze_batch([sample_text, ""]) == [expected, analyzer.analyze_readability("")]
+    assert analyzer.analyze_batch([sample_text] * PARALLEL_THRESHOLD, workers=2) == [expected] * PARALLEL_THRESHOLD
+
 def test_empty_text(analyzer):
     """Test analysis with empty text."""
     results = analyzer.analyze_readability("")
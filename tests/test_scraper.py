@@ -2,7 +2,7 @@
 Tests for the web scraper module.
 """
 import pytest
-from src.scraper import WebScraper
+from src.scraper import WebScraper, meta_index, parse_html
 from bs4 import BeautifulSoup
 
 # Sample HTML content for testing
@@ -38,10 +38,13 @@ class TestWebScraper:
         return WebScraper()
 
     @pytest.fixture
-    def mock_response(self, mocker):
-        """Create a mock response for requests."""
-        mock = mocker.patch('requests.get')
-        mock.return_value.text = SAMPLE_HTML
+    def mock_response(self, scraper, mocker):
+        """Create a mock response for the scraper's session."""
+        mock = mocker.patch.object(scraper.session, 'get')
+        mock.return_value.iter_content.return_value = [SAMPLE_HTML.encode('utf-8')]
+        mock.return_value.encoding = 'utf-8'
+        mock.return_value.status_code = 200
+        mock.return_value.headers = {}
         mock.return_value.raise_for_status = lambda: None
         return mock
 
@@ -49,14 +52,67 @@ class TestWebScraper:
         """Test successful page fetch."""
         result = scraper.fetch_page("http://example.com")
         assert result == SAMPLE_HTML
-        mock_response.assert_called_once_with("http://example.com", timeout=30)
+        mock_response.assert_called_once_with("http://example.com", timeout=30, stream=True, headers={})
+        mock_response.return_value.close.assert_called_once()
+
+    def test_fetch_page_truncates_large_pages(self, scraper, mock_response):
+        """Test that the body stops at max_bytes."""
+        scraper.max_bytes = 10
+        result = scraper.fetch_page("http://example.com")
+        assert result == SAMPLE_HTML[:10]
+
+    def test_fetch_page_revalidates_with_etag(self, scraper, mock_response):
+        """Test that a cached page is revalidated and reused on 304 Not Modified."""
+        mock_response.return_value.headers = {'ETag': '"v1"'}
+        assert scraper.fetch_page("http://example.com") == SAMPLE_HTML
+        
+        mock_response.return_value.status_code = 304
+        mock_response.return_value.iter_content.return_value = []
+        assert scraper.fetch_page("http://example.com") == SAMPLE_HTML
+        mock_response.assert_called_with(
+            "http://example.com", timeout=30, stream=True, headers={'If-None-Match': '"v1"'}
+        )
+
+    def test_fetch_page_respects_no_store(self, scraper, mock_response):
+        """Test that pages marked no-store are not cached."""
+        mock_response.return_value.headers = {'ETag': '"v1"', 'Cache-Control': 'no-store'}
+        scraper.fetch_page("http://example.com")
+        assert "http://example.com" not in scraper._cache
+
+    def test_fetch_page_does_not_cache_truncated_pages(self, scraper, mock_response):
+        """Test that a body cut off at max_bytes is never revalidated."""
+        mock_response.return_value.headers = {'ETag': '"v1"'}
+        scraper.max_bytes = 10
+        scraper.fetch_page("http://example.com")
+        assert "http://example.com" not in scraper._cache
+
+    def test_validator_cache_is_bounded(self, scraper, mock_response, mocker):
+        """Test that the least recently fetched pages are dropped first."""
+        mocker.patch('src.scraper.VALIDATOR_CACHE_SIZE', 2)
+        mock_response.return_value.headers = {'ETag': '"v1"'}
+        for url in ("http://a.com", "http://b.com", "http://a.com", "http://c.com"):
+            scraper.fetch_page(url)
+        assert list(scraper._cache) == ["http://a.com", "http://c.com"]
+
+    def test_read_timeouts_are_not_retried(self, scraper):
+        """Test that only connection errors are retried, not slow responses."""
+        retries = scraper.session.get_adapter("https://example.com").max_retries
+        assert retries.total == 2
+        assert retries.read == 0
 
     def test_fetch_page_failure(self, scraper, mocker):
         """Test failed page fetch."""
-        mock = mocker.patch('requests.get', side_effect=Exception("Connection error"))
+        mock = mocker.patch.object(scraper.session, 'get', side_effect=Exception("Connection error"))
         result = scraper.fetch_page("http://example.com")
         assert result is None
-        mock.assert_called_once_with("http://example.com", timeout=30)
+        mock.assert_called_once_with("http://example.com", timeout=30, stream=True, headers={})
+
+    def test_fetch_many(self, scraper, mocker):
+        """Test concurrent fetching keeps URL order and reports failures as None."""
+        pages = {"http://a.com": "<p>a</p>", "http://b.com": None, "http://c.com": "<p>c</p>"}
+        mocker.patch.object(scraper, 'fetch_page', side_effect=pages.get)
+        assert scraper.fetch_many(list(pages)) == list(pages.values())
+        assert scraper.fetch_many([]) == []
 
     def test_get_title(self, scraper):
         """Test title extraction."""
@@ -90,6 +146,8 @@ class TestWebScraper:
         assert "Main Header" in content
         assert "This is some test content" in content
         assert "More test content here" in content
+        # The tree is not modified
+        assert soup.find('script') is not None
 
     def test_extract_content_complete(self, scraper):
         """Test complete content extraction."""
@@ -99,4 +157,39 @@ class TestWebScraper:
         assert result['meta_description'] == "This is a test page description"
         assert isinstance(result['main_content'], str)
         assert isinstance(result['headers'], dict)
-        assert len(result['headers']) == 2  # h1 and h2 present 
\ No newline at end of file
+        assert len(result['headers']) == 2  # h1 and h2 present
+
+    def test_extract_content_backends_agree(self, scraper):
+        """Test that the selectolax and BeautifulSoup paths extract the same content."""
+        pytest.importorskip('selectolax')
+        mixed_case = '<html><head><META NAME="Description" content="D"></head><body><h1>T</h1></body></html>'
+        hidden_text = (
+            '<html><body><h1>Head<script>var x=1</script><style>h1{}</style>line</h1>'
+            '<p><ruby>kan<rp>(</rp><rt>ka</rt><rp>)</rp></ruby></p>'
+            '<template><p>hidden</p></template></body></html>'
+        )
+        for html in (SAMPLE_HTML, mixed_case, hidden_text):
+            fast = WebScraper(use_selectolax=True).extract_content(html)
+            fallback = WebScraper(use_selectolax=False).extract_content(html)
+            assert fast == fallback
+        fast = WebScraper(use_selectolax=True)
+        assert fast.extract_content(mixed_case)['meta_description'] == "D"
+        assert fast.extract_content(hidden_text)['headers'] == {'h1': ['Headline']}
+
+
+def test_parse_html_reuses_recent_trees():
+    """Test that the same content is parsed once and different content separately."""
+    soup = parse_html(SAMPLE_HTML)
+    assert parse_html(SAMPLE_HTML) is soup
+    assert parse_html(SAMPLE_HTML.encode('utf-8')) is soup
+    assert parse_html("<p>other</p>") is not soup
+    assert soup.find('title').text == "Test Page"
+
+def test_meta_index_built_once():
+    """Test that meta tags are indexed by lowercased name once per tree."""
+    soup = BeautifulSoup('<meta name="Description" content="first"><meta name="description" content="second">'
+                         '<meta charset="utf-8">', 'html.parser')
+    index = meta_index(soup)
+    assert index['description']['content'] == "first"
+    assert list(index) == ['description']
+    assert meta_index(soup) is index
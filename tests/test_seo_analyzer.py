@@ -2,7 +2,8 @@
 Tests for the SEO analyzer module.
 """
 import pytest
-from src.seo_analyzer import SEOAnalyzer
+from bs4 import BeautifulSoup
+from src.seo_analyzer import PARALLEL_THRESHOLD, SEOAnalyzer
 
 # Sample HTML content for testing
 SAMPLE_HTML = """
@@ -44,9 +45,9 @@ SAMPLE_HTML = """
 """
 
 class TestSEOAnalyzer:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def analyzer(self):
-        """Create an SEOAnalyzer instance for testing."""
+        """Create an SEOAnalyzer instance shared by the tests, which never modify it."""
         return SEOAnalyzer()
 
     @pytest.fixture
@@ -54,9 +55,14 @@ class TestSEOAnalyzer:
         """Provide base URL for testing."""
         return "https://example.com"
 
-    def test_meta_tags_analysis(self, analyzer):
+    @pytest.fixture(scope="class")
+    def analysis(self, analyzer):
+        """Analyze SAMPLE_HTML once for every test that only reads the result."""
+        return analyzer.analyze(SAMPLE_HTML, "https://example.com")
+
+    def test_meta_tags_analysis(self, analysis):
         """Test meta tags analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['meta_tags']
+        result = analysis['meta_tags']
         
         assert result['title']['content'] == "Test Page Title"
         assert result['meta_description']['content'] == "This is a test page description"
@@ -72,9 +78,9 @@ class TestSEOAnalyzer:
         assert result['twitter_cards']['twitter:card'] == "summary"
         assert result['twitter_cards']['twitter:title'] == "Twitter Title"
 
-    def test_keyword_analysis(self, analyzer):
+    def test_keyword_analysis(self, analysis):
         """Test keyword analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['keyword_analysis']
+        result = analysis['keyword_analysis']
         
         assert result['total_words'] > 0
         assert result['unique_words'] > 0
@@ -86,9 +92,9 @@ class TestSEOAnalyzer:
         assert seo_keyword is not None
         assert result['top_keywords'][seo_keyword]['count'] == 2
 
-    def test_content_analysis(self, analyzer):
+    def test_content_analysis(self, analysis):
         """Test content structure analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['content_analysis']
+        result = analysis['content_analysis']
         
         assert result['paragraph_count'] == 2
         assert result['heading_structure']['h1'] == 1
@@ -96,9 +102,9 @@ class TestSEOAnalyzer:
         assert result['content_length'] > 0
         assert 0 <= result['text_html_ratio'] <= 100
 
-    def test_link_analysis(self, analyzer, base_url):
+    def test_link_analysis(self, analysis):
         """Test link analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, base_url)['link_analysis']
+        result = analysis['link_analysis']
         
         assert result['internal_links']['count'] == 1
         assert result['external_links']['count'] == 1
@@ -114,9 +120,9 @@ class TestSEOAnalyzer:
         assert external['url'] == "https://external.com"
         assert external['nofollow'] is True
 
-    def test_image_analysis(self, analyzer):
+    def test_image_analysis(self, analysis):
         """Test image analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['image_analysis']
+        result = analysis['image_analysis']
         
         assert result['total_images'] == 2
         assert result['images_with_alt'] == 1
@@ -127,9 +133,9 @@ class TestSEOAnalyzer:
         assert any(img['alt'] == "Test Image" for img in images)
         assert any(img['has_dimensions'] for img in images)
 
-    def test_technical_seo(self, analyzer):
+    def test_technical_seo(self, analysis):
         """Test technical SEO analysis."""
-        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['technical_seo']
+        result = analysis['technical_seo']
         
         assert result['has_viewport'] is True
         assert result['has_favicon'] is True
@@ -148,4 +154,116 @@ class TestSEOAnalyzer:
         assert result['path_segments'] == ['blog', 'post']
         assert result['has_query_params'] is True
         assert result['has_fragment'] is True
-        assert result['is_clean_url'] is False 
\ No newline at end of file
+        assert result['is_clean_url'] is False
+
+    def test_parser_is_configurable(self, base_url):
+        """Test that the tree builder can be chosen and gives the same link and image results."""
+        fast = SEOAnalyzer().analyze(SAMPLE_HTML, base_url)
+        fallback = SEOAnalyzer(parser='html.parser').analyze(SAMPLE_HTML, base_url)
+        for section in ('meta_tags', 'link_analysis', 'image_analysis'):
+            assert fast[section] == fallback[section]
+
+    def test_parser_backends_agree(self, base_url):
+        """Test that the lexbor and BeautifulSoup paths give the same analysis."""
+        pytest.importorskip('selectolax')
+        hidden_text = (
+            '<p>Read <style>.a{}</style>this<!-- note --> <b>now<script>x()</script></b></p>'
+            '<p><ruby>kan<rt>ka</rt></ruby> ji</p>'
+            '<a href="/go">Go <style>.a{}</style>now</a>'
+        )
+        for html in (SAMPLE_HTML, hidden_text):
+            fast = SEOAnalyzer(parser='lexbor').analyze(html, base_url)
+            fallback = SEOAnalyzer(parser='lxml').analyze(html, base_url)
+            assert fast == fallback
+
+    def test_strained_parse_matches_full_soup(self, analyzer, base_url):
+        """Test that parsing only the analyzed tags gives the same results as a full tree."""
+        strained = analyzer.analyze(SAMPLE_HTML, base_url)
+        full = analyzer.analyze(SAMPLE_HTML, base_url, BeautifulSoup(SAMPLE_HTML, 'lxml'))
+        for section in ('meta_tags', 'keyword_analysis', 'link_analysis', 'image_analysis', 'technical_seo'):
+            assert strained[section] == full[section]
+        assert strained['content_analysis']['heading_structure'] == full['content_analysis']['heading_structure']
+
+    def test_scan_meta_tags(self, analyzer):
+        """Test reading meta attributes from raw HTML across quoting styles."""
+        html = """
+        <META NAME="description" CONTENT="a > b &amp; c">
+        <meta property='og:title' content='OG'>
+        <meta name=viewport content=width=device-width>
+        <!-- <meta name="robots" content="noindex"> -->
+        """
+        assert analyzer._scan_meta_tags(html) == [
+            {'name': 'description', 'content': 'a > b & c'},
+            {'property': 'og:title', 'content': 'OG'},
+            {'name': 'viewport', 'content': 'width=device-width'},
+        ]
+
+    def test_meta_inside_script_is_ignored(self, analyzer, base_url):
+        """Test that meta markup inside script, style or textarea bodies is not read as a tag."""
+        html = """
+        <head><meta name="description" content="real">
+        <script>document.write("<meta name='robots' content='noindex'>");</script>
+        <style>/* <meta name="viewport" content="x"> */</style></head>
+        <body><textarea><meta name="keywords" content="k"></textarea></body>
+        """
+        assert analyzer._scan_meta_tags(html) == [{'name': 'description', 'content': 'real'}]
+        result = analyzer.analyze(html, base_url)
+        assert result['meta_tags']['robots'] == ''
+        assert result['technical_seo']['has_robots_txt'] is False
+
+    def test_raw_text_matches_soup_text(self, analyzer):
+        """Test that text read from the raw HTML keeps a bare '<' and skips hidden elements."""
+        html = """
+        <html><body><p>If a < b then b > a &amp; c</p>
+        <template><p>hidden</p></template>
+        <ruby>kan<rp>(</rp><rt>ka</rt><rp>)</rp></ruby>
+        <script>var x = "<b>";</script></body></html>
+        """
+        soup_text = BeautifulSoup(html, 'lxml').get_text()
+        assert analyzer._get_raw_text(html).split() == soup_text.split()
+        assert 'b then b' in analyzer._get_raw_text(html)
+
+    def test_page_text_extracted_once(self, analyzer, base_url, mocker):
+        """Test that a full soup's text is read once and shared by the keyword and content checks."""
+        soup = BeautifulSoup(SAMPLE_HTML, 'lxml')
+        get_text = mocker.spy(soup, 'get_text')
+        result = analyzer.analyze(SAMPLE_HTML, base_url, soup)
+        assert get_text.call_count == 1
+        assert result['content_analysis']['content_length'] == len(get_text.spy_return)
+
+    def test_text_html_ratio_uses_raw_html_length(self, analyzer):
+        """Test that the ratio is taken against the input HTML length, not a re-serialized tree."""
+        assert analyzer._calculate_text_html_ratio('abc', 300) == 1.0
+        assert analyzer._calculate_text_html_ratio('abc', 0) == 0
+        result = analyzer.analyze(SAMPLE_HTML, "https://example.com")['content_analysis']
+        assert result['text_html_ratio'] == result['content_length'] / len(SAMPLE_HTML) * 100
+
+    def test_is_internal(self, analyzer):
+        """Test link classification, including the relative-href shortcut."""
+        assert analyzer._is_internal('/about', 'https://example.com/about', 'example.com')
+        assert analyzer._is_internal('#top', 'https://example.com/#top', 'example.com')
+        assert analyzer._is_internal('page', 'https://example.com/page', 'example.com')
+        assert not analyzer._is_internal('//cdn.com/a', 'https://cdn.com/a', 'example.com')
+        assert not analyzer._is_internal('https://other.com', 'https://other.com', 'example.com')
+
+    def test_tags_collected_in_one_traversal(self, analyzer, base_url, mocker):
+        """Test that headings and every other analyzed tag come from a single find_all walk."""
+        soup = BeautifulSoup(SAMPLE_HTML, 'lxml')
+        find_all = mocker.spy(soup, 'find_all')
+        result = analyzer.analyze(SAMPLE_HTML, base_url, soup)
+        assert find_all.call_count == 1
+        assert result['content_analysis']['heading_structure'] == {
+            'h1': 1, 'h2': 2, 'h3': 0, 'h4': 0, 'h5': 0, 'h6': 0
+        }
+
+    def test_analyze_batch(self, analyzer, base_url):
+        """Test that batch analysis matches analyzing each page on its own."""
+        expected = analyzer.analyze(SAMPLE_HTML, base_url)
+        assert analyzer.analyze_batch([(SAMPLE_HTML, base_url)]) == [expected]
+        pages = [(SAMPLE_HTML, base_url)] * PARALLEL_THRESHOLD
+        assert analyzer.analyze_batch(pages, workers=2) == [expected] * PARALLEL_THRESHOLD
+
+    def test_keyword_analysis_skips_thin_pages(self, analyzer):
+        """Test that pages with too few words report totals but no top keywords."""
+        result = analyzer.analyze("<p>Short page about SEO and more SEO</p>", "https://example.com")['keyword_analysis']
+        assert result == {'top_keywords': {}, 'total_words': 6, 'unique_words': 5}
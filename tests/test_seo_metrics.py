@@ -2,77 +2,87 @@
 Tests for the SEO metrics module.
 """
 import pytest
+from types import MappingProxyType
 from src.seo_metrics import SEOMetrics
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seo_metrics():
     """Create a SEOMetrics instance for testing."""
     return SEOMetrics()
 
-@pytest.fixture
-def sample_analysis():
-    """Create a sample SEO analysis for testing."""
-    return {
-        'content_analysis': {
-            'content_length': 1500,
-            'heading_structure': {
-                'h1': 1,
-                'h2': 3,
-                'h3': 5
-            },
-            'paragraph_count': 10,
-            'avg_paragraph_length': 150,
-            'text_html_ratio': 25,
-            'main_content': 'This is a sample text. It has multiple sentences. The text is used for testing readability scores.'
-        },
-        'meta_tags': {
-            'title': {
-                'content': 'Sample Title - Test Page',
-                'length': 25,
-                'found': True
-            },
-            'meta_description': {
-                'content': 'This is a sample meta description for testing purposes.',
-                'length': 55,
-                'found': True
-            }
-        },
-        'keyword_analysis': {
-            'top_keywords': {
-                'sample': {'density': 2.5},
-                'test': {'density': 1.8},
-                'content': {'density': 1.2}
-            }
+def _freeze(value):
+    """Wrap nested dicts in read-only mapping proxies, so tests cannot alter shared data."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+# Sample SEO analysis shared by every test; writes to it raise TypeError
+_SAMPLE_ANALYSIS = _freeze({
+    'content_analysis': {
+        'content_length': 1500,
+        'heading_structure': {
+            'h1': 1,
+            'h2': 3,
+            'h3': 5
         },
-        'link_analysis': {
-            'internal_links': {
-                'count': 5,
-                'links': [
-                    {'text': 'Home', 'url': '/home'},
-                    {'text': 'About', 'url': '/about'}
-                ]
-            },
-            'external_links': {
-                'count': 3,
-                'links': [
-                    {'text': 'External Site', 'url': 'https://example.com'},
-                    {'text': 'Another Site', 'url': 'https://another.com'}
-                ]
-            }
+        'paragraph_count': 10,
+        'avg_paragraph_length': 150,
+        'text_html_ratio': 25,
+        'main_content': 'This is a sample text. It has multiple sentences. The text is used for testing readability scores.'
+    },
+    'meta_tags': {
+        'title': {
+            'content': 'Sample Title - Test Page',
+            'length': 25,
+            'found': True
         },
-        'image_analysis': {
-            'total_images': 4,
-            'images_with_alt': 3,
-            'images_with_dimensions': 2
+        'meta_description': {
+            'content': 'This is a sample meta description for testing purposes.',
+            'length': 55,
+            'found': True
+        }
+    },
+    'keyword_analysis': {
+        'top_keywords': {
+            'sample': {'density': 2.5},
+            'test': {'density': 1.8},
+            'content': {'density': 1.2}
+        }
+    },
+    'link_analysis': {
+        'internal_links': {
+            'count': 5,
+            'links': [
+                {'text': 'Home', 'url': '/home'},
+                {'text': 'About', 'url': '/about'}
+            ]
         },
-        'technical_seo': {
-            'has_viewport': True,
-            'has_favicon': True,
-            'has_structured_data': False,
-            'has_analytics': True,
-            'has_robots_txt': True
+        'external_links': {
+            'count': 3,
+            'links': [
+                {'text': 'External Site', 'url': 'https://example.com'},
+                {'text': 'Another Site', 'url': 'https://another.com'}
+            ]
         }
+    },
+    'image_analysis': {
+        'total_images': 4,
+        'images_with_alt': 3,
+        'images_with_dimensions': 2
+    },
+    'technical_seo': {
+        'has_viewport': True,
+        'has_favicon': True,
+        'has_structured_data': False,
+        'has_analytics': True,
+        'has_robots_txt': True
     }
+})
+
+@pytest.fixture(scope="module")
+def sample_analysis():
+    """Provide the sample SEO analysis for testing."""
+    return _SAMPLE_ANALYSIS
 
 def test_compute_metrics(seo_metrics, sample_analysis):
     """Test the main compute_metrics method."""
@@ -121,6 +131,17 @@ def test_readability_metrics(seo_metrics, sample_analysis):
         'Fairly Difficult', 'Difficult', 'Very Difficult', 'Unknown'
     ]
 
+def test_readability_is_cached_by_text(sample_analysis, mocker):
+    """Test that readability is computed once per distinct text and cached copies are independent."""
+    # A fresh instance, as the shared one has cached the sample text already
+    seo_metrics = SEOMetrics()
+    compute = mocker.spy(SEOMetrics, '_text_readability')
+    first = seo_metrics._compute_readability(sample_analysis)
+    first['readability_level'] = 'changed'
+    second = seo_metrics._compute_readability(sample_analysis)
+    assert compute.call_count == 1
+    assert second['readability_level'] != 'changed'
+
 def test_keyword_optimization(seo_metrics, sample_analysis):
     """Test keyword optimization metrics calculation."""
     metrics = seo_metrics._compute_keyword_optimization(sample_analysis)
@@ -157,7 +178,12 @@ def test_technical_score(seo_metrics, sample_analysis):
 
 def test_overall_score(seo_metrics, sample_analysis):
     """Test overall score calculation."""
-    metrics = seo_metrics._compute_overall_score(sample_analysis)
+    sections = seo_metrics.compute_metrics(sample_analysis)
+    metrics = seo_metrics._compute_overall_score(
+        sections['content_quality'], sections['technical_score'], sections['keyword_optimization'],
+        sections['link_quality'], sections['image_optimization']
+    )
+    assert metrics == sections['overall_score']
     
     assert 0 <= metrics['overall_score'] <= 1
     assert all(0 <= score <= 1 for score in metrics['score_breakdown'].values())
@@ -184,16 +210,41 @@ def test_count_syllables(seo_metrics):
     assert seo_metrics._count_syllables('a') == 1
     assert seo_metrics._count_syllables('test') == 1
 
-def test_get_readability_level(seo_metrics):
+def test_count_syllables_per_word(seo_metrics):
+    """Test that syllables are counted word by word, with at least one each."""
+    assert seo_metrics._count_syllables('make the cake') == 3
+    assert seo_metrics._count_syllables('Beautiful day, 42') == 5
+    assert seo_metrics._count_syllables('cake cake cake') == 3
+
+def test_count_syllables_matches_word_split(seo_metrics):
+    """Test that contractions and hyphenated words count as the single words the word count sees."""
+    assert seo_metrics._count_syllables("don't") == 1
+    assert seo_metrics._count_syllables("it's you're we'll") == 3
+    assert seo_metrics._count_syllables('well-known') == 2
+    assert seo_metrics._count_syllables('the cake.') == 2
+
+@pytest.mark.parametrize("score,level", [
+    (95, 'Very Easy'),
+    (85, 'Easy'),
+    (75, 'Fairly Easy'),
+    (65, 'Standard'),
+    (55, 'Fairly Difficult'),
+    (25, 'Very Difficult'),
+    (15, 'Very Difficult'),
+    (-1, 'Unknown'),
+])
+def test_get_readability_level(seo_metrics, score, level):
     """Test readability level determination."""
-    assert seo_metrics._get_readability_level(95) == 'Very Easy'
-    assert seo_metrics._get_readability_level(85) == 'Easy'
-    assert seo_metrics._get_readability_level(75) == 'Fairly Easy'
-    assert seo_metrics._get_readability_level(65) == 'Standard'
-    assert seo_metrics._get_readability_level(55) == 'Fairly Difficult'
-    assert seo_metrics._get_readability_level(25) == 'Difficult'
-    assert seo_metrics._get_readability_level(15) == 'Very Difficult'
-    assert seo_metrics._get_readability_level(-1) == 'Unknown'
+    assert seo_metrics._get_readability_level(score) == level
+
+def test_readability_level_boundaries(seo_metrics):
+    """Test that each level starts at its threshold and invalid scores are unknown."""
+    assert seo_metrics._get_readability_level(90) == 'Very Easy'
+    assert seo_metrics._get_readability_level(89.9) == 'Easy'
+    assert seo_metrics._get_readability_level(30) == 'Difficult'
+    assert seo_metrics._get_readability_level(0) == 'Very Difficult'
+    assert seo_metrics._get_readability_level(float('nan')) == 'Unknown'
+    assert seo_metrics._get_readability_level(None) == 'Unknown'
 
 def test_get_keywords_in_text(seo_metrics):
     """Test keyword extraction from text."""
@@ -217,25 +268,21 @@ def test_calculate_link_text_score(seo_metrics):
     score = seo_metrics._calculate_link_text_score(links)
     assert 0 <= score <= 1
 
-def test_error_handling(seo_metrics):
+@pytest.mark.parametrize("bad_input", [
+    None,
+    {},
+    {'content_analysis': {}},
+    {'content_analysis': {'content_length': 'invalid', 'heading_structure': None}},
+], ids=["none", "empty", "missing", "invalid"])
+def test_error_handling(seo_metrics, bad_input):
     """Test error handling with invalid data."""
-    # Test with None
-    metrics = seo_metrics.compute_metrics(None)
-    assert metrics['overall_score']['overall_score'] == 0.0
-    
-    # Test with empty dict
-    metrics = seo_metrics.compute_metrics({})
+    metrics = seo_metrics.compute_metrics(bad_input)
     assert metrics['overall_score']['overall_score'] == 0.0
-    
-    # Test with missing keys
-    metrics = seo_metrics.compute_metrics({'content_analysis': {}})
-    assert metrics['overall_score']['overall_score'] == 0.0
-    
-    # Test with invalid values
-    metrics = seo_metrics.compute_metrics({
-        'content_analysis': {
-            'content_length': 'invalid',
-            'heading_structure': None
-        }
-    })
-    assert metrics['overall_score']['overall_score'] == 0.0 
\ No newline at end of file
+
+def test_errors_are_logged_not_printed(seo_metrics, capsys, caplog):
+    """Test that a failing section is reported through debug logging only."""
+    with caplog.at_level('DEBUG', logger='src.seo_metrics'):
+        metrics = seo_metrics.compute_metrics({'content_analysis': {}})
+    assert metrics == seo_metrics._get_default_metrics()
+    assert capsys.readouterr().out == ''
+    assert 'Error computing metrics' in caplog.text